@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+"""Checks that cleanup_text() takes time linear in the size of its input."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from parse_arrl_pool import cleanup_text
+
+# An errata-like line that mentions the first question, repeated many
+# times to give cleanup_text() lots of candidate header ends to skip.
+ERRATA_LINE = 'T1A01 was revised; see the “errata” for T1A01 details.\n'
+POOL_TAIL = ('T1A01 (C) [97.1]\nWhat is the purpose?\nA. One\nB. Two\n'
+             'C. Three\nD. Four\n~~\n')
+
+def time_cleanup(megabytes: int) -> float:
+    """Return the seconds cleanup_text() takes on megabytes of text."""
+    text = ERRATA_LINE * (megabytes * (1 << 20) // len(ERRATA_LINE))
+    text += POOL_TAIL
+    start = time.perf_counter()
+    assert cleanup_text(text) == POOL_TAIL
+    return time.perf_counter() - start
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-m', '--max-megabytes', type=int, default=16,
+                      metavar='MB', help='Largest input size to time.')
+    argp.add_argument('-r', '--max-ratio', type=float, default=3.0,
+                      help='Fail if the time per megabyte grows by more '
+                      'than this factor from the smallest input.')
+    args = argp.parse_args()
+
+    first_per_mb = 0.0
+    megabytes = 1
+    while megabytes <= args.max_megabytes:
+        seconds = time_cleanup(megabytes)
+        per_mb = seconds / megabytes
+        first_per_mb = first_per_mb or per_mb
+        print(f'{megabytes:4} MB: {seconds:.4f}s ({per_mb * 1000:.3f} ms/MB)')
+        megabytes *= 2
+
+    if per_mb > first_per_mb * args.max_ratio:
+        print('cleanup_text() is not scaling linearly', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""Checks and times -I/-E with long lists of question numbers.
+
+The same lists are applied to a generated .txt pool (with and without
+the cache) and to the compiled pool and SQLite database made from it.
+It fails if any run fails or gives different questions from the rest.
+"""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from make_pool import NUMBERS # pylint: disable=import-error
+from make_pool import make_pool # pylint: disable=import-error
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                      'parse_arrl_pool.py')
+
+def run(args: List[str], env: dict[str, str]) -> str:
+    """Return the output of running the script with args."""
+    return subprocess.run([sys.executable, SCRIPT, *args], env=env,
+                          check=True, text=True,
+                          stdout=subprocess.PIPE).stdout
+
+def write_numbers(filename: str, count: int) -> None:
+    """Write count question numbers to filename, one per line.
+
+    Every other number is used, so some are not in the pool when count
+    is more than half of its questions.
+    """
+    with open(filename, 'w', encoding='utf-8') as numbers_file:
+        for number in NUMBERS[:2 * count:2]:
+            numbers_file.write(number + '\n')
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--questions', type=int, default=10000,
+                      metavar='N', help='Generate a pool of N questions.')
+    argp.add_argument('-l', '--list-length', type=int, default=5000,
+                      metavar='N',
+                      help='List N question numbers for -I and -E.')
+    args = argp.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, XDG_CACHE_HOME=temp_dir)
+        pool = os.path.join(temp_dir, 'pool.txt')
+        compiled = os.path.join(temp_dir, 'pool.pool')
+        database = os.path.join(temp_dir, 'pool.db')
+        numbers = os.path.join(temp_dir, 'numbers.txt')
+        make_pool(pool, args.questions)
+        run(['--compile', compiled, pool], env)
+        run(['--sqlite', database, pool], env)
+        write_numbers(numbers, args.list_length)
+
+        for option in ('-I', '-E'):
+            outputs = {}
+            for name, run_args in (('txt', ['--no-cache', pool]),
+                                   ('cached', [pool]),
+                                   ('compiled', [compiled]),
+                                   ('sqlite', [database])):
+                start = time.perf_counter()
+                try:
+                    outputs[name] = run([option, numbers, *run_args], env)
+                except subprocess.CalledProcessError:
+                    print(f'{option} {name}: failed', file=sys.stderr)
+                    failed = True
+                    continue
+                print(f'{option} {name}: '
+                      f'{(time.perf_counter() - start) * 1000:.1f}ms, '
+                      f'{outputs[name].count("~~")} questions')
+            if len(set(outputs.values())) > 1:
+                print(f'{option}: the outputs differ', file=sys.stderr)
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""Checks the startup time of parse_arrl_pool.py on text-only runs.
+
+Each run is timed as a whole and again under 'python -X importtime' to
+see which modules were imported.  The time taken by the interpreter to
+run nothing is subtracted from both.  It fails if a run is over budget
+or imports a module that only some inputs or options need.
+"""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+from typing import Tuple
+
+from make_pool import make_pool # pylint: disable=import-error
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                      'parse_arrl_pool.py')
+
+# Modules that a run on an ASCII .txt pool should not need.
+UNWANTED_MODULES = ('concurrent.futures', 'curses', 'pdfminer', 'sqlite3',
+                    'unidecode', 'xml.etree', 'zipfile')
+
+def time_run(args: List[str], env: dict[str, str], repeat: int) -> float:
+    """Return the best wall time of repeat runs of python with args."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def get_imports(args: List[str],
+                env: dict[str, str]) -> Tuple[float, List[str]]:
+    """Return the import time and modules imported by python with args."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            env=env, check=True, text=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.append(name.strip())
+        if not name.startswith('  '):
+            # Only count the top-level imports as they include the others.
+            total_us += int(cumulative)
+    return total_us / 1e6, modules
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--questions', type=int, default=1000,
+                      metavar='N', help='Generate a pool of N questions.')
+    argp.add_argument('-r', '--repeat', type=int, default=5, metavar='N',
+                      help='Time the best of N runs.')
+    argp.add_argument('-b', '--budget', type=float, default=100.0,
+                      metavar='MS', help='Fail if a run takes longer than '
+                      'MS milliseconds more than the interpreter takes to '
+                      'run nothing (default: %(default)s).')
+    args = argp.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, XDG_CACHE_HOME=temp_dir)
+        pool = os.path.join(temp_dir, 'pool.txt')
+        make_pool(pool, args.questions)
+        subprocess.run([sys.executable, SCRIPT, pool], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        base_seconds = time_run(['-c', 'pass'], env, args.repeat)
+        base_import_seconds, _ = get_imports(['-c', 'pass'], env)
+        print(f'interpreter: {base_seconds * 1000:.1f}ms '
+              f'(imports {base_import_seconds * 1000:.1f}ms)')
+        for name, run_args in (('txt', ['--no-cache', '-i', 'T1', pool]),
+                               ('cached', ['-i', 'T1', pool])):
+            seconds = time_run([SCRIPT, *run_args], env,
+                               args.repeat) - base_seconds
+            import_seconds, modules = get_imports([SCRIPT, *run_args], env)
+            import_seconds -= base_import_seconds
+            unwanted = sorted({module for module in modules
+                               if module.startswith(UNWANTED_MODULES)})
+            print(f'{name}: +{seconds * 1000:.1f}ms '
+                  f'(imports +{import_seconds * 1000:.1f}ms)')
+            if unwanted:
+                print(f'{name}: imported {", ".join(unwanted)}',
+                      file=sys.stderr)
+                failed = True
+            if seconds * 1000 > args.budget:
+                print(f'{name}: over the budget of {args.budget}ms',
+                      file=sys.stderr)
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
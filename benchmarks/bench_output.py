@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Times writing the questions of pools to a pipe one at a time and in chunks."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import TextIO
+from typing import Tuple
+from typing import cast
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from parse_arrl_pool import Question
+from parse_arrl_pool import iter_pool_questions
+from parse_arrl_pool import write_questions
+
+def print_questions(questions: Iterable[Question],
+                    output_file: TextIO) -> Tuple[int, int]:
+    """Write questions with a print() each like the original main()."""
+    count = 0
+    size = 0
+    for question in questions:
+        text = str(question)
+        print(text, file=output_file)
+        count += 1
+        size += len(text) + 1
+    return count, size
+
+def time_to_pipe(writer: Callable[[Iterable[Question], TextIO],
+                                  Tuple[int, int]],
+                 questions: List[Question]) -> float:
+    """Return how long writer takes to write questions through a pipe.
+
+    The time includes waiting for the reader of the pipe to finish.
+    """
+    start = time.perf_counter()
+    with subprocess.Popen(['cat'], stdin=subprocess.PIPE,
+                          stdout=subprocess.DEVNULL, text=True) as reader:
+        assert reader.stdin
+        writer(questions, cast(TextIO, reader.stdin))
+        reader.stdin.close()
+    return time.perf_counter() - start
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-r', '--repeat', type=int, default=5, metavar='N',
+                      help='Time the best of N runs.')
+    argp.add_argument('-c', '--copies', type=int, default=1, metavar='N',
+                      help='Write the questions N times over.')
+    argp.add_argument('question_pools', nargs='+', metavar='POOL_FILES',
+                      help='.docx, .pdf or .txt containing a question pool')
+    args = argp.parse_args()
+
+    questions = list(iter_pool_questions(args.question_pools)) * args.copies
+    for name, writer in (('print', print_questions),
+                         ('write_questions', write_questions)):
+        best = min(time_to_pipe(writer, questions)
+                   for _ in range(args.repeat))
+        print(f'{name}: {len(questions)} questions in {best * 1000:.1f}ms')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+"""Compares serial and page-parallel extraction of pool PDFs."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from parse_arrl_pool import get_text_from_pdf
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                      metavar='N', help='Number of processes to compare.')
+    argp.add_argument('pdf_files', nargs='+', metavar='PDF_FILES',
+                      help='.pdf files containing a question pool')
+    args = argp.parse_args()
+
+    for filename in args.pdf_files:
+        start = time.perf_counter()
+        serial_text = get_text_from_pdf(filename)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel_text = get_text_from_pdf(filename, args.jobs)
+        parallel_time = time.perf_counter() - start
+
+        assert parallel_text == serial_text
+        print(f'{filename}: serial {serial_time:.2f}s, '
+              f'{args.jobs} jobs {parallel_time:.2f}s, '
+              f'speedup {serial_time / parallel_time:.2f}x')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
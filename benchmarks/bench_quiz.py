@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""Times simulated quiz sessions driven through QuizSession.
+
+The time taken by next_question() is reported separately as it is what
+a user waits for between questions.
+"""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from parse_arrl_pool import Layout
+from parse_arrl_pool import QuizSession
+from parse_arrl_pool import iter_pool_questions
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--sessions', type=int, default=100, metavar='N',
+                      help='Simulate N sessions.')
+    argp.add_argument('-q', '--questions', type=int, default=35, metavar='N',
+                      help='Ask up to N questions per session (like an '
+                      'exam).')
+    argp.add_argument('-s', '--shuffle-abcd', action='store_true',
+                      help='Shuffle the multiple-choices.')
+    argp.add_argument('-p', '--prefetch', type=int, default=0, metavar='N',
+                      help='Prepare N questions ahead in the background.')
+    argp.add_argument('-t', '--think-time', type=float, default=0.0,
+                      metavar='SECONDS',
+                      help='Wait this long before answering each question '
+                      'at random.  If 0, each question is answered correctly '
+                      'at once and threads are switched as often as possible '
+                      'to shake out races with the prefetching thread.')
+    argp.add_argument('question_pools', nargs='+', metavar='POOL_FILES',
+                      help='.docx, .pdf or .txt containing a question pool')
+    args = argp.parse_args()
+
+    pool = {question.question_number: question
+            for question in iter_pool_questions(args.question_pools)}
+    thread_errors = []
+    def record_thread_error(hook_args: threading.ExceptHookArgs) -> None:
+        thread_errors.append(hook_args.exc_type.__name__)
+    threading.excepthook = record_thread_error
+    if not args.think_time:
+        sys.setswitchinterval(1e-6)
+
+    # Like a kiosk that runs one session after another.
+    layouts: dict[Tuple[str, int], Layout] = {}
+    asked = 0
+    next_seconds = 0.0
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session = QuizSession(dict(pool), args.shuffle_abcd,
+                              prefetch=args.prefetch, layouts=layouts)
+        for _ in range(args.questions):
+            next_start = time.perf_counter()
+            if session.next_question() is None:
+                break
+            next_seconds += time.perf_counter() - next_start
+            if args.think_time:
+                time.sleep(args.think_time)
+                session.answer(random.choice('ABCDS'))
+            else:
+                # Delete each question as soon as it is asked.
+                session.answer(session.correct_answer)
+            asked += 1
+        session.close()
+    seconds = time.perf_counter() - start
+    print(f'{args.sessions} sessions ({asked} questions) in {seconds:.3f}s: '
+          f'{args.sessions / seconds:.0f} sessions/s, '
+          f'{asked / seconds:.0f} questions/s, '
+          f'{next_seconds / max(asked, 1) * 1e6:.1f}us per next_question()')
+    if thread_errors:
+        print(f'{len(thread_errors)} errors in prefetching threads: '
+              f'{", ".join(sorted(set(thread_errors)))}', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""Counts the bytes the quiz sends to the terminal for each question.
+
+parse_arrl_pool.py -a is run in a pseudo-terminal and each question is
+skipped (which shows the correct answer) until the quiz is quit.
+"""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import fcntl
+import os
+import pty
+import select
+import struct
+import sys
+import tempfile
+import termios
+import time
+
+from make_pool import make_pool # pylint: disable=import-error
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                      'parse_arrl_pool.py')
+
+def read_until_quiet(fd: int, quiet: float) -> int:
+    """Read from fd until nothing arrives for quiet seconds.
+
+    Return the number of bytes read.
+    """
+    count = 0
+    while select.select([fd], [], [], quiet)[0]:
+        try:
+            data = os.read(fd, 65536)
+        except OSError:
+            break
+        if not data:
+            break
+        count += len(data)
+    return count
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--questions', type=int, default=20, metavar='N',
+                      help='Skip N questions.')
+    argp.add_argument('-s', '--shuffle-abcd', action='store_true',
+                      help='Shuffle the multiple-choices.')
+    argp.add_argument('--rows', type=int, default=24,
+                      help='The height of the terminal.')
+    argp.add_argument('--cols', type=int, default=80,
+                      help='The width of the terminal.')
+    argp.add_argument('--quiet', type=float, default=0.2, metavar='SECONDS',
+                      help='How long output must stop for before the next '
+                      'key is sent.')
+    args = argp.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pool = os.path.join(temp_dir, 'pool.txt')
+        make_pool(pool, args.questions + 1)
+        pid, fd = pty.fork()
+        if not pid:
+            os.environ.update(TERM=os.environ.get('TERM', 'xterm'),
+                              LINES=str(args.rows), COLUMNS=str(args.cols),
+                              XDG_CACHE_HOME=temp_dir)
+            os.execv(sys.executable,
+                     [sys.executable, SCRIPT, '-a', '-o', os.devnull,
+                      *(['-s'] if args.shuffle_abcd else []), pool])
+        fcntl.ioctl(fd, termios.TIOCSWINSZ,
+                    struct.pack('HHHH', args.rows, args.cols, 0, 0))
+
+        start_bytes = read_until_quiet(fd, 1.0)
+        start = time.perf_counter()
+        question_bytes = 0
+        for _ in range(args.questions):
+            for key in (b's', b' '):
+                os.write(fd, key)
+                question_bytes += read_until_quiet(fd, args.quiet)
+        os.write(fd, b'q')
+        end_bytes = read_until_quiet(fd, args.quiet)
+        os.waitpid(pid, 0)
+        os.close(fd)
+
+    print(f'start {start_bytes} bytes, {args.questions} questions '
+          f'{question_bytes} bytes ({question_bytes / args.questions:.0f} '
+          f'bytes/question), end {end_bytes} bytes, '
+          f'{time.perf_counter() - start:.1f}s')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
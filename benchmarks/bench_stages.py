@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+"""Times each stage of parsing pools and tracks regressions across commits.
+
+The stages follow what parse_arrl_pool.py does for each file: parsing
+it without the cache, parsing it and filling the cache, reading it back
+from the cache through iter_pool_questions() and iter_wanted_questions()
+and then write_questions().  Unless POOL_FILES are given, synthetic
+pools are generated with make_pool.py for each size and format.
+"""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from make_pool import make_pool
+from parse_arrl_pool import Question
+from parse_arrl_pool import QuestionFilter
+from parse_arrl_pool import get_cache_filename
+from parse_arrl_pool import iter_file_questions
+from parse_arrl_pool import iter_pool_questions
+from parse_arrl_pool import iter_wanted_questions
+from parse_arrl_pool import write_questions
+
+Result = TypeVar('Result')
+
+def best_time(function: Callable[[], Result],
+              repeat: int) -> Tuple[float, Result]:
+    """Return the best time of repeat calls of function and its result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def fill_cache(filename: str) -> List[Question]:
+    """Parse filename into an empty cache and return its Questions."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(get_cache_filename(filename))
+    return list(iter_file_questions(filename))
+
+def time_stages(filename: str, repeat: int) -> dict[str, float]:
+    """Return the best time in seconds of each stage for filename.
+
+    The cache is in get_cache_dir(), which should be a temporary one.
+    """
+    timings = {}
+    timings['parse'], _ = best_time(
+        lambda: list(iter_file_questions(filename, use_cache=False)), repeat)
+    timings['fill_cache'], _ = best_time(lambda: fill_cache(filename),
+                                         repeat)
+    is_wanted = QuestionFilter(None, None)
+    timings['cached'], questions = best_time(
+        lambda: list(iter_wanted_questions(iter_pool_questions([filename]),
+                                           is_wanted)), repeat)
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        timings['write'], _ = best_time(
+            lambda: write_questions(questions, devnull), repeat)
+    return timings
+
+def get_commit() -> str:
+    """Return a description of the commit being benchmarked."""
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def read_last_results(history: str) -> Optional[dict[str, dict[str, float]]]:
+    """Return the results of the last run recorded in history, if any."""
+    try:
+        with open(history, encoding='utf-8') as history_file:
+            lines = history_file.read().splitlines()
+    except FileNotFoundError:
+        return None
+    if not lines:
+        return None
+    results: dict[str, dict[str, float]] = json.loads(lines[-1])['results']
+    return results
+
+def find_regressions(last: dict[str, dict[str, float]],
+                     results: dict[str, dict[str, float]],
+                     threshold: float) -> List[str]:
+    """Return descriptions of stages that are slower than in last."""
+    regressions = []
+    for label, timings in results.items():
+        for stage, seconds in timings.items():
+            before = last.get(label, {}).get(stage)
+            if before and seconds > before * (1 + threshold):
+                regressions.append(f'{label} {stage}: {before * 1000:.1f}ms '
+                                   f'-> {seconds * 1000:.1f}ms')
+    return regressions
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--questions', type=int, action='append',
+                      metavar='N',
+                      help='Generate pools of N questions (default: 1000).')
+    argp.add_argument('-f', '--format', action='append',
+                      choices=('txt', 'docx', 'pdf'),
+                      help='Generate pools of this format (default: all).')
+    argp.add_argument('--noise', action='store_true',
+                      help='Generate pools with smart quotes, hyphenation '
+                      'breaks and missing regulations.')
+    argp.add_argument('-r', '--repeat', type=int, default=3, metavar='N',
+                      help='Time the best of N runs.')
+    argp.add_argument('--history', metavar='FILE',
+                      help='Compare with the last results in FILE and then '
+                      'append these results to it.')
+    argp.add_argument('-t', '--threshold', type=float, default=0.2,
+                      help='Fail if a stage is slower than in the history '
+                      'by more than this fraction (default: %(default)s).')
+    argp.add_argument('question_pools', nargs='*', metavar='POOL_FILES',
+                      help='.docx, .pdf or .txt containing a question pool')
+    args = argp.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ['XDG_CACHE_HOME'] = temp_dir
+        filenames = args.question_pools
+        if not filenames:
+            for count in args.questions or [1000]:
+                for extension in args.format or ['txt', 'docx', 'pdf']:
+                    filename = os.path.join(
+                        temp_dir, f'pool-{count}{"-noise" * args.noise}'
+                        f'.{extension}')
+                    make_pool(filename, count, args.noise, args.noise,
+                              args.noise)
+                    filenames.append(filename)
+        for filename in filenames:
+            label = os.path.basename(filename)
+            results[label] = time_stages(filename, args.repeat)
+            print(f'{label}: ' + ', '.join(
+                f'{stage} {seconds * 1000:.1f}ms'
+                for stage, seconds in results[label].items()))
+
+    if not args.history:
+        return 0
+    last = read_last_results(args.history)
+    with open(args.history, 'a', encoding='utf-8') as history_file:
+        history_file.write(json.dumps({'commit': get_commit(),
+                                       'time': time.time(),
+                                       'results': results}) + '\n')
+    regressions = find_regressions(last or {}, results, args.threshold)
+    for regression in regressions:
+        print(f'regression: {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
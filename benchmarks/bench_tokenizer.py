@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""Compares the question tokenizer with the regular expression it replaced."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+import contextlib
+import io
+import re
+
+from parse_arrl_pool import iter_file_text
+from parse_arrl_pool import iter_questions
+
+# The regular expression that iter_questions() replaced
+QA_RE = re.compile(r'(?P<QuestionNumber>[TGE][0-9][A-Z][0-9]{2}) ?'
+                   r'\((?P<Answer>[A-D])\)'
+                   r'(?P<Regulation>\s*?\[[^]~]+?\])?\s*?'
+                   r'(?P<Question>[^~]+?)\s*?'
+                   r'A\. *?(?P<ChoiceA>[^~]+?)\s*?'
+                   r'B\. *?(?P<ChoiceB>[^~]+?)\s*?'
+                   r'C\. *?(?P<ChoiceC>[^~]+?)\s*?'
+                   r'D\. *?(?P<ChoiceD>[^~]+?)\s*?~+')
+
+# A question missing its D. choice and its '~~' terminator
+MALFORMED_QUESTION = ('T1A01 (B) [97.1]\nWhat is the purpose?\nA. One\n'
+                      'B. Two\nC. Three\n\n')
+
+def compare(name: str, text: str) -> None:
+    """Print how long QA_RE and iter_questions() take to parse text."""
+    start = time.perf_counter()
+    re_count = sum(1 for _ in QA_RE.finditer(text))
+    re_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with contextlib.redirect_stderr(io.StringIO()):
+        tokenizer_count = sum(1 for _ in iter_questions([text]))
+    tokenizer_time = time.perf_counter() - start
+
+    print(f'{name}: QA_RE {re_count} questions in {re_time:.4f}s, '
+          f'tokenizer {tokenizer_count} questions in {tokenizer_time:.4f}s')
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-m', '--malformed', type=int, default=16, metavar='N',
+                      help='Also time up to N malformed questions.')
+    argp.add_argument('question_pools', nargs='*', metavar='POOL_FILES',
+                      help='.docx, .pdf or .txt containing a question pool')
+    args = argp.parse_args()
+
+    for filename in args.question_pools:
+        compare(filename, ''.join(iter_file_text(filename)))
+
+    count = 8
+    while count <= args.malformed:
+        compare(f'{count} malformed questions',
+                MALFORMED_QUESTION * count + '~~\n')
+        count *= 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
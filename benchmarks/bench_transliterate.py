@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""Compares transliterate() with running unidecode() over whole pools."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+# pylint: disable=wrong-import-position,import-error
+from unidecode import unidecode
+
+from parse_arrl_pool import get_file_type
+from parse_arrl_pool import transliterate
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-r', '--repeat', type=int, default=5, metavar='N',
+                      help='Time the best of N runs.')
+    argp.add_argument('question_pools', nargs='+', metavar='POOL_FILES',
+                      help='.docx, .pdf or .txt containing a question pool')
+    args = argp.parse_args()
+
+    for filename in args.question_pools:
+        extractor = get_file_type(filename).extractor
+        assert extractor, f'{filename} is not a .docx, .pdf or .txt'
+        text = ''.join(extractor(filename, 1))
+        timings = {}
+        for name, function in (('unidecode', unidecode),
+                               ('transliterate', transliterate)):
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = function(text)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best
+        assert result == unidecode(text)
+        print(f'{filename}: {len(text)} characters, '
+              f'unidecode {timings["unidecode"] * 1000:.1f}ms, '
+              f'transliterate {timings["transliterate"] * 1000:.1f}ms')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+"""Generates synthetic question pools as .txt, .docx or .pdf files."""
+
+# BSD Zero Clause License
+#
+# Copyright (c) 2024 Scott A. Anderson
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+# AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+
+import argparse
+import itertools
+import os
+import random
+import sys
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from xml.sax.saxutils import escape
+import zipfile
+
+# Question numbers in the order they are generated.  There are only so
+# many distinct numbers, so larger pools repeat them (other than the
+# first one, which would otherwise look like the start of the pool).
+# A repeated number always gets exactly the same question, so the
+# repeats are dropped when the pool is parsed.
+NUMBERS = [f'T{subelement}{group}{number:02}'
+           for subelement in range(1, 10)
+           for group in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+           for number in range(1, 100)]
+
+HEADER = ('Technician Class Question Pool\n'
+          'Errata: T1A01 was revised.\n\n')
+
+def iter_numbers(count: int) -> Iterator[Tuple[int, str]]:
+    """Yield count question numbers in order with their index in NUMBERS."""
+    numbered = list(enumerate(NUMBERS))
+    return itertools.islice(
+        itertools.chain(numbered, itertools.cycle(numbered[1:])), count)
+
+def make_question(index: int,
+                  number: str,
+                  smart_quotes: bool,
+                  hyphenation: bool,
+                  missing_regulations: bool) -> List[str]:
+    """Return the lines of question number, the index-th distinct one.
+
+    The noise is chosen at random but seeded by number so that a repeated
+    number gives the same lines.
+    """
+    rand = random.Random(number)
+    answer = rand.choice('ABCD')
+    regulation = f' [97.{index % 120 + 1}]'
+    if missing_regulations and rand.random() < 0.5:
+        regulation = ''
+    open_quote, close_quote, dash = '"', '"', '--'
+    if smart_quotes:
+        open_quote, close_quote, dash = '“', '”', '—'
+    question = [f'Which choice is the {open_quote}answer{close_quote} to '
+                f'item {index} about half-wave antennas?']
+    if hyphenation and rand.random() < 0.5:
+        # Break the line after the hyphen as a PDF might.
+        first, second = question[0].split('half-')
+        question = [first + 'half-', second]
+    return [f'{number} ({answer}){regulation}', *question,
+            f'A. The first choice {dash} {index}',
+            f'B. The second choice {dash} {index}',
+            f'C. The third choice {dash} {index}',
+            'D. All of these choices are correct',
+            '~~',
+            '']
+
+def iter_pool_lines(count: int,
+                    smart_quotes: bool = False,
+                    hyphenation: bool = False,
+                    missing_regulations: bool = False) -> Iterator[str]:
+    """Yield the lines of a pool with count questions."""
+    yield from HEADER.splitlines()
+    for index, number in iter_numbers(count):
+        yield from make_question(index, number, smart_quotes, hyphenation,
+                                 missing_regulations)
+
+def write_txt(lines: Iterator[str], filename: str) -> None:
+    """Write lines to filename as a .txt pool."""
+    with open(filename, 'w', encoding='utf-8') as txt_file:
+        for line in lines:
+            txt_file.write(line + '\n')
+
+def write_docx(lines: Iterator[str], filename: str) -> None:
+    """Write lines to filename as a minimal .docx pool, one per paragraph."""
+    namespace = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as docx_file, \
+         docx_file.open('word/document.xml', 'w') as xml_file:
+        xml_file.write(f'<?xml version="1.0" encoding="UTF-8"?>'
+                       f'<w:document xmlns:w="{namespace}"><w:body>'.encode())
+        for line in lines:
+            xml_file.write(f'<w:p><w:r><w:t xml:space="preserve">'
+                           f'{escape(line)}</w:t></w:r></w:p>'.encode())
+        xml_file.write(b'</w:body></w:document>')
+
+def pdf_string(line: str) -> bytes:
+    """Return line as a PDF string in WinAnsiEncoding."""
+    encoded = line.encode('cp1252')
+    for special in (b'\\', b'(', b')'):
+        encoded = encoded.replace(special, b'\\' + special)
+    return b'(' + encoded + b')'
+
+def write_pdf(lines: Iterator[str], filename: str,
+              lines_per_page: int = 50) -> None:
+    """Write lines to filename as a minimal .pdf pool."""
+    all_lines = list(lines)
+    pages = [all_lines[start:start + lines_per_page]
+             for start in range(0, len(all_lines), lines_per_page)]
+    # The catalog, page tree and font are followed by each page and its
+    # contents.
+    kids = ' '.join(f'{4 + 2 * index} 0 R' for index in range(len(pages)))
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>',
+               f'<< /Type /Pages /Kids [{kids}] '
+               f'/Count {len(pages)} >>'.encode(),
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica '
+               b'/Encoding /WinAnsiEncoding >>']
+    for index, page in enumerate(pages):
+        contents = (b'BT /F1 10 Tf 14 TL 40 760 Td ' +
+                    b' '.join(pdf_string(line) + b' Tj T*' for line in page) +
+                    b' ET')
+        objects.append(f'<< /Type /Page /Parent 2 0 R '
+                       f'/MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> '
+                       f'/Contents {5 + 2 * index} 0 R >>'.encode())
+        objects.append(f'<< /Length {len(contents)} >>\nstream\n'.encode() +
+                       contents + b'\nendstream')
+
+    with open(filename, 'wb') as pdf_file:
+        pdf_file.write(b'%PDF-1.4\n')
+        offsets = []
+        for index, pdf_object in enumerate(objects):
+            offsets.append(pdf_file.tell())
+            pdf_file.write(f'{index + 1} 0 obj\n'.encode() + pdf_object +
+                           b'\nendobj\n')
+        xref_offset = pdf_file.tell()
+        pdf_file.write(f'xref\n0 {len(objects) + 1}\n'
+                       f'0000000000 65535 f \n'.encode())
+        for offset in offsets:
+            pdf_file.write(f'{offset:010} 00000 n \n'.encode())
+        pdf_file.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+                       f'startxref\n{xref_offset}\n%%EOF\n'.encode())
+
+WRITERS = {
+    '.txt': write_txt,
+    '.docx': write_docx,
+    '.pdf': write_pdf,
+}
+
+def make_pool(filename: str,
+              count: int,
+              smart_quotes: bool = False,
+              hyphenation: bool = False,
+              missing_regulations: bool = False) -> None:
+    """Write a pool with count questions to filename.
+
+    The type of file is chosen by the extension of filename.
+    """
+    WRITERS[os.path.splitext(filename)[1]](
+        iter_pool_lines(count, smart_quotes, hyphenation, missing_regulations),
+        filename)
+
+def main() -> int:
+    """The main event."""
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', '--questions', type=int, default=1000,
+                      metavar='N', help='Generate N questions.')
+    argp.add_argument('-q', '--smart-quotes', action='store_true',
+                      help='Use smart quotes and em dashes.')
+    argp.add_argument('-H', '--hyphenation', action='store_true',
+                      help='Break some lines after a hyphen.')
+    argp.add_argument('-r', '--missing-regulations', action='store_true',
+                      help='Leave out some of the regulations.')
+    argp.add_argument('pool_file', metavar='POOL_FILE',
+                      help='.docx, .pdf or .txt file to write')
+    args = argp.parse_args()
+    if os.path.splitext(args.pool_file)[1] not in WRITERS:
+        argp.error('POOL_FILE must end with .docx, .pdf or .txt')
+
+    make_pool(args.pool_file, args.questions, args.smart_quotes,
+              args.hyphenation, args.missing_regulations)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+from typing import (BinaryIO, Container, Iterator, Optional)
+class PDFPage():
+    @classmethod
+    def get_pages(
+        cls,
+        fp: BinaryIO,
+        pagenos: Optional[Container[int]] = None,
+        maxpages: int = 0,
+        password: str = "",
+        caching: bool = True,
+        check_extractable: bool = False,
+    ) -> Iterator["PDFPage"]: ...
@@ -1,3 +0,0 @@
-class PSException(Exception): ...
-class PDFException(PSException): ...
-class PDFSyntaxError(PDFException): ...
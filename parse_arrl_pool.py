@@ -21,32 +21,283 @@
 # mypy --strict parse_arrl_pool.py mypy_stubs
 # pylint parse_arrl_pool.py
 
+# pylint: disable=too-many-lines
+# Modules that are slow to import or only needed for some inputs or
+# options are imported where they are used so that startup stays fast.
+# pylint: disable=import-outside-toplevel
+
 import argparse
-import curses
+import contextlib
+import hashlib
+import itertools
+import json
+import mmap
+import os
 import random
 import re
+import struct
 import sys
+import tempfile
 import textwrap
+import threading
+import time
 from typing import TYPE_CHECKING
+from typing import IO
+from typing import ContextManager
+from typing import Generic
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Pattern
+from typing import TextIO
 from typing import Tuple
-from xml.etree.cElementTree import XML
-import zipfile
-
-from pdfminer.high_level import extract_text
-from pdfminer.pdfparser import PDFSyntaxError
-from unidecode import unidecode
+from typing import TypeVar
 
 if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
     from _curses import _CursesWindow # pylint: disable=no-name-in-module
     Window = _CursesWindow
 else:
     from typing import Any # pylint: disable=ungrouped-imports
     Window = Any
 
-FIRST_QUESTION_RE = re.compile(r'[TGE]1A01 ')
+T = TypeVar('T')
+
+class StageStats(): # pylint: disable=too-few-public-methods
+    """What has been recorded about one stage of processing one file."""
+    __slots__ = ('wall', 'cpu', 'size', 'peak')
+
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.size = 0
+        self.peak = 0
+
+def get_size(item: object) -> int:
+    """Return the number of characters in item (e.g. text or a Question)."""
+    if isinstance(item, (str, bytes)):
+        return len(item)
+    if isinstance(item, Question):
+        return sum(len(field) for field in item.fields())
+    if isinstance(item, (list, tuple)):
+        return sum(get_size(part) for part in item)
+    return 0
+
+class Profiler():
+    """Record the time, size and memory of each stage of each file.
+
+    The stages are nested (e.g. the parser pulls text from the
+    extractor) so the time is charged to whichever stage is innermost
+    at the time.  The peak memory of a stage includes its nested stages.
+    Memory is traced with tracemalloc, which slows everything down.
+    """
+    def __init__(self) -> None:
+        self.stats: dict[Tuple[str, str], StageStats] = {}
+        self.stack: List[StageStats] = []
+        self.start_wall = self.last_wall = time.perf_counter()
+        self.start_cpu = self.last_cpu = time.process_time()
+        import tracemalloc
+        self.tracemalloc = tracemalloc
+        tracemalloc.start()
+
+    def charge(self) -> None:
+        """Charge what happened since the last call to the current stage."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if self.stack:
+            self.stack[-1].wall += wall - self.last_wall
+            self.stack[-1].cpu += cpu - self.last_cpu
+            peak = self.tracemalloc.get_traced_memory()[1]
+            for stats in self.stack:
+                stats.peak = max(stats.peak, peak)
+            self.tracemalloc.reset_peak()
+        self.last_wall = wall
+        self.last_cpu = cpu
+
+    @contextlib.contextmanager
+    def section(self, source: str, stage: str) -> Iterator[StageStats]:
+        """Charge the time spent in the with statement to source's stage."""
+        self.charge()
+        stats = self.stats.setdefault((source, stage), StageStats())
+        self.stack.append(stats)
+        try:
+            yield stats
+        finally:
+            self.charge()
+            self.stack.pop()
+
+    def iter_stage(self, source: str, stage: str, items: Iterable[T],
+                   count_size: bool = True) -> Iterator[T]:
+        """Yield items, charging the time to get each to source's stage."""
+        with self.section(source, stage):
+            iterator = iter(items)
+        while True:
+            with self.section(source, stage) as stats:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                if count_size:
+                    stats.size += get_size(item)
+            yield item
+
+    def merge(self, stats: dict[Tuple[str, str], StageStats]) -> None:
+        """Add stats recorded by another Profiler (e.g. in a worker)."""
+        for key, other in stats.items():
+            ours = self.stats.setdefault(key, StageStats())
+            ours.wall += other.wall
+            ours.cpu += other.cpu
+            ours.size += other.size
+            ours.peak = max(ours.peak, other.peak)
+
+    def print_summary(self, output_file: TextIO) -> None:
+        """Print a table of the recorded stages to output_file."""
+        self.charge()
+        rows = sorted(((source, stage, stats)
+                       for (source, stage), stats in self.stats.items()),
+                      key=lambda row: row[0] == '(all)')
+        totals: dict[str, List[StageStats]] = {}
+        for (_, stage), stats in self.stats.items():
+            totals.setdefault(stage, []).append(stats)
+        for stage, stage_stats in totals.items():
+            if len(stage_stats) > 1:
+                total = StageStats()
+                total.wall = sum(stats.wall for stats in stage_stats)
+                total.cpu = sum(stats.cpu for stats in stage_stats)
+                total.size = sum(stats.size for stats in stage_stats)
+                total.peak = max(stats.peak for stats in stage_stats)
+                rows.append(('(all)', stage, total))
+        overall = StageStats()
+        overall.wall = self.last_wall - self.start_wall
+        overall.cpu = self.last_cpu - self.start_cpu
+        overall.peak = max((stats.peak for stats in self.stats.values()),
+                           default=0)
+        rows.append(('(total)', '', overall))
+
+        width = max(len(source) for source, _, _ in rows)
+        print(f'{"file":{width}} {"stage":8} {"wall s":>9} {"cpu s":>9} '
+              f'{"chars":>12} {"peak MiB":>9}', file=output_file)
+        for source, stage, stats in rows:
+            print(f'{source:{width}} {stage:8} {stats.wall:9.3f} '
+                  f'{stats.cpu:9.3f} {stats.size:12} '
+                  f'{stats.peak / (1 << 20):9.1f}', file=output_file)
+
+class ProfiledIterable(Generic[T]): # pylint: disable=too-few-public-methods
+    """Items that are profiled each time they are iterated over.
+
+    Only the first iteration counts towards the size of the stage.
+    """
+    def __init__(self, profiler: Profiler, source: str, stage: str,
+                 items: Iterable[T]) -> None:
+        self.profiler = profiler
+        self.source = source
+        self.stage = stage
+        self.items = items
+        self.iterated = False
+
+    def __iter__(self) -> Iterator[T]:
+        count_size = not self.iterated
+        self.iterated = True
+        return self.profiler.iter_stage(self.source, self.stage, self.items,
+                                        count_size)
+
+# The Profiler used when --profile is given.
+PROFILER: Optional[Profiler] = None
+
+def profiled(source: str, stage: str, items: Iterable[T]) -> Iterable[T]:
+    """Return items so that getting them is charged to source's stage."""
+    if PROFILER is None:
+        return items
+    return ProfiledIterable(PROFILER, source, stage, items)
+
+def profiled_section(source: str,
+                     stage: str) -> ContextManager[Optional[StageStats]]:
+    """Return a context manager that charges its time to source's stage.
+
+    It gives the stage's StageStats (e.g. to add to its size), or None
+    when not profiling.
+    """
+    if PROFILER is None:
+        return contextlib.nullcontext()
+    return PROFILER.section(source, stage)
+
+# What unidecode() gives for the non-ASCII characters that are common
+# in the pools so that it only needs to be used for rarer ones.
+COMMON_TRANSLITERATIONS = str.maketrans({
+    '\u00A0': ' ',    # no-break space
+    '\u00B0': 'deg',  # degree sign
+    '\u00B1': '+-',   # plus-minus sign
+    '\u00B5': 'u',    # micro sign
+    '\u00D7': 'x',    # multiplication sign
+    '\u03A9': 'O',    # Greek capital omega
+    '\u2013': '-',    # en dash
+    '\u2014': '--',   # em dash
+    '\u2018': "'",    # left single quotation mark
+    '\u2019': "'",    # right single quotation mark
+    '\u201C': '"',    # left double quotation mark
+    '\u201D': '"',    # right double quotation mark
+    '\u2026': '...',  # horizontal ellipsis
+    '\u2212': '-',    # minus sign
+    '\uFEFF': '',     # byte order mark
+})
+NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+def transliterate_span(match_obj: re.Match[str]) -> str:
+    """Return the ASCII version of the non-ASCII text matched."""
+    span = match_obj.group().translate(COMMON_TRANSLITERATIONS)
+    if span.isascii():
+        return span
+    from unidecode import unidecode
+    return unidecode(span)
+
+def transliterate(text: str) -> str:
+    """Return the passed text with Unicode characters decoded into ASCII.
+
+    This gives the same result as unidecode() but only the runs of
+    non-ASCII characters in text are looked at.
+    """
+    if text.isascii():
+        return text
+    return NON_ASCII_RE.sub(transliterate_span, text)
+
+FIRST_QUESTION_NUMBERS = ('T1A01 ', 'G1A01 ', 'E1A01 ')
 EXTRA_SPACE_RE = re.compile(r'([0-9a-z]-)\s+([a-z])', re.IGNORECASE)
+# The end of a chunk that EXTRA_SPACE_RE might join to the next chunk
+EXTRA_SPACE_TAIL_RE = re.compile(r'(?:[0-9a-z]-\s*)+\Z', re.IGNORECASE)
+
+def iter_clean_text(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield a cleaned-up version of the text in chunks
+
+    This is the streaming version of cleanup_text().  chunks is iterated
+    twice: once to find where the question pool starts and then again
+    to yield the cleaned-up text from there on a chunk at a time.
+    The chunks must not split a question number.
+    """
+    # Scan backwards for the last first question so that the time taken
+    # does not depend on how many times it is mentioned.
+    start_index = 0
+    start_offset = 0
+    for index, chunk in enumerate(chunks):
+        offset = max(chunk.rfind(number) for number in FIRST_QUESTION_NUMBERS)
+        if offset >= 0:
+            start_index = index
+            start_offset = offset
+
+    pending = ''
+    for index, chunk in enumerate(itertools.islice(chunks, start_index, None)):
+        if not index:
+            chunk = chunk[start_offset:]
+        text = pending + transliterate(chunk)
+        # Hold back anything that may need joining to the next chunk.
+        tail = EXTRA_SPACE_TAIL_RE.search(text)
+        split_index = tail.start() if tail else len(text)
+        pending = text[split_index:]
+        yield EXTRA_SPACE_RE.sub(r'\1\2', text[:split_index])
+    yield EXTRA_SPACE_RE.sub(r'\1\2', pending)
+
 def cleanup_text(text: str) -> str:
     """Returned a cleaned-up version of the passed text
 
@@ -54,124 +305,301 @@ def cleanup_text(text: str) -> str:
     and then Unicode characters (e.g. quotes and dashes) in the text
     are decoded into ASCII.  The result is returned.
     """
-    search_index = 0
-    while True:
-        match_obj = FIRST_QUESTION_RE.search(text[search_index+1:])
-        if not match_obj:
-            break
-        search_index += match_obj.start() + 1
-    text = text[search_index:]
-    text = unidecode(text)
-    text = EXTRA_SPACE_RE.sub(r'\1\2', text)
-    return text
+    return ''.join(iter_clean_text([text]))
 
 WORD_NAMESPACE = ('{http://schemas.openxmlformats.org/'
                   'wordprocessingml/2006/main}')
 PARA = WORD_NAMESPACE + 'p'
 TEXT = WORD_NAMESPACE + 't'
 
-def get_text_from_docx(filename: str) -> str:
-    """Return the text extracted from the passed .docx filename"""
-    document = zipfile.ZipFile(filename)
-    xml_content = document.read('word/document.xml')
-    document.close()
-    tree = XML(xml_content)
+class DocxParagraphs(): # pylint: disable=too-few-public-methods
+    """The paragraphs of a .docx file, which are parsed as it is iterated.
+
+    Each paragraph is yielded as soon as it has been parsed and then its
+    XML elements are discarded so memory use does not grow with the size
+    of the document's XML.  Only the text of the paragraphs is kept so
+    that iterating again (as iter_clean_text() does) does not parse the
+    XML again.
+    """
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.paragraphs: Optional[List[str]] = None
 
-    paragraphs = []
-    for paragraph in tree.iter(PARA):
-        texts = [node.text
-                 for node in paragraph.iter(TEXT)
-                 if node.text]
-        if texts:
-            paragraphs.append(''.join(texts))
+    def __iter__(self) -> Iterator[str]:
+        if self.paragraphs is not None:
+            return iter(self.paragraphs)
+        return self.iter_parsed()
 
-    return '\n\n'.join(paragraphs)
+    def iter_parsed(self) -> Iterator[str]:
+        """Yield the paragraphs as they are parsed and remember them."""
+        from xml.etree.ElementTree import iterparse
+        import zipfile
+        with zipfile.ZipFile(self.filename) as document, \
+             document.open('word/document.xml') as xml_file:
+            open_elements: List[Element] = []
+            # Paragraphs can be nested (e.g. in text boxes) so they are
+            # only yielded, in the order they started, once the
+            # outermost one has ended.
+            paragraphs: List[Element] = []
+            open_paragraph_count = 0
+            parsed: List[str] = []
+            for event, element in iterparse(xml_file, ('start', 'end')):
+                if event == 'start':
+                    open_elements.append(element)
+                    if element.tag == PARA:
+                        paragraphs.append(element)
+                        open_paragraph_count += 1
+                    continue
 
-def get_text_from_file(filenames: List[str]) -> str:
-    """Return the text extracted from the filename passed
+                open_elements.pop()
+                if element.tag == PARA:
+                    open_paragraph_count -= 1
+                if open_paragraph_count:
+                    continue
+                for paragraph in paragraphs:
+                    texts = [node.text
+                             for node in paragraph.iter(TEXT)
+                             if node.text]
+                    if texts:
+                        parsed.append(''.join(texts) + '\n\n')
+                        yield parsed[-1]
+                paragraphs.clear()
+                element.clear()
+                if open_elements:
+                    open_elements[-1].remove(element)
+        self.paragraphs = parsed
 
-    The filename can refer to either a .pdf, .docx or .txt file.
+def get_text_from_docx(filename: str,
+                       jobs: int = 1 # pylint: disable=unused-argument
+                       ) -> DocxParagraphs:
+    """Return the paragraphs of the passed .docx filename"""
+    return DocxParagraphs(filename)
+
+def extract_pdf_pages(filename: str, pages: range) -> str:
+    """Return the text extracted from pages of the passed .pdf filename"""
+    from pdfminer.high_level import extract_text
+    return extract_text(filename, page_numbers=pages)
+
+def get_text_from_pdf(filename: str, jobs: int = 1) -> List[str]:
+    """Return the text extracted from the passed .pdf filename
+
+    The text of the whole file is returned as one chunk and so is held
+    in memory.  If jobs is greater than one, the pages are instead split
+    into that many ranges which are extracted by separate processes and
+    the text of each range is returned separately.
     """
-    all_text = ''
-    for filename in filenames:
-        try:
-            file_text = extract_text(filename)
-        except PDFSyntaxError:
-            pass
-        else:
-            all_text += cleanup_text(file_text)
-            continue
+    from pdfminer.high_level import extract_text
+    if jobs <= 1:
+        return [extract_text(filename)]
 
-        try:
-            file_text = get_text_from_docx(filename)
-        except zipfile.BadZipFile:
-            pass
-        else:
-            all_text += cleanup_text(file_text)
-            continue
+    from pdfminer.pdfpage import PDFPage
+    with open(filename, 'rb') as pdf_file:
+        page_count = sum(1 for _ in PDFPage.get_pages(pdf_file))
+    pages_per_job = -(-page_count // jobs)
+    if pages_per_job < 1:
+        return [extract_text(filename)]
+    page_ranges = [range(first, min(first + pages_per_job, page_count))
+                   for first in range(0, page_count, pages_per_job)]
+
+    # pdfminer ends each page with a form feed so the text of the ranges
+    # can simply be concatenated in page order.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(len(page_ranges)) as executor:
+        return list(executor.map(extract_pdf_pages,
+                                 itertools.repeat(filename),
+                                 page_ranges))
+
+class TextFileLines(): # pylint: disable=too-few-public-methods
+    """The lines of a .txt file, which are read each time it is iterated."""
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.filename, 'rb') as text_file:
+            for line in text_file:
+                # Deal with some published files having an extraneous '\xFF'
+                yield line.replace(b'\xFF', b'').decode()
+
+def get_text_from_txt(filename: str,
+                      jobs: int = 1 # pylint: disable=unused-argument
+                      ) -> TextFileLines:
+    """Return the lines of the passed .txt filename"""
+    return TextFileLines(filename)
 
-        with open(filename, 'rb') as text_file:
-            # Deal with some published files having an extraneous '\xFF'
-            file_bytes = text_file.read().replace(b'\xFF', b'')
-            file_text = file_bytes.decode()
-            all_text += cleanup_text(file_text)
-    return all_text
-
-QA_RE = re.compile(r'(?P<QuestionNumber>[TGE][0-9][A-Z][0-9]{2}) ?'
-                   r'\((?P<Answer>[A-D])\)'
-                   r'(?P<Regulation>\s*?\[[^]]+?\])?\s*?'
-                   r'(?P<Question>[^~]+?)\s*?'
-                   r'A\. *?(?P<ChoiceA>[^~]+?)\s*?'
-                   r'B\. *?(?P<ChoiceB>[^~]+?)\s*?'
-                   r'C\. *?(?P<ChoiceC>[^~]+?)\s*?'
-                   r'D\. *?(?P<ChoiceD>[^~]+?)\s*?~+')
+# An extractor is passed a filename and the number of processes it may
+# use and returns the text of the file as chunks split at line breaks.
+# It must be possible to iterate over the chunks more than once.  Only
+# the lines of a .txt file are read as they are needed; the text of a
+# .pdf or .docx is held in memory.
+Extractor = Callable[[str, int], Iterable[str]]
+
+def iter_file_text(filename: str,
+                   jobs: int = 1,
+                   extractor: Optional[Extractor] = None) -> Iterator[str]:
+    """Yield the cleaned-up text extracted from filename in chunks
+
+    The type of filename (.pdf, .docx or .txt) is determined from its
+    contents rather than its name, unless extractor is given.  Up to
+    jobs processes are used to extract it.
+    """
+    if extractor is None:
+        extractor = get_file_type(filename).extractor
+        assert extractor, f'{filename} does not need to be parsed'
+    with profiled_section(filename, 'extract'):
+        chunks = extractor(filename, jobs)
+    return iter(profiled(filename, 'clean', iter_clean_text(
+        profiled(filename, 'extract', chunks))))
+
+# A question is made up of these parts in order and ends with '~'.
+# None of the parts may contain '~'.
+QUESTION_START_RE = re.compile(r'(?P<QuestionNumber>[TGE][0-9][A-Z][0-9]{2})'
+                               r' ?\((?P<Answer>[A-D])\)')
+REGULATION_RE = re.compile(r'\s*\[[^]~]+\]')
+CHOICE_MARKERS = ('A.', 'B.', 'C.', 'D.')
+# Text between two '~'s without a QUESTION_START_RE match is only
+# reported as a malformed question if it matches this (e.g. it has
+# something like a question number or a choice) rather than being
+# other text, such as a trailer at the end of the pool.
+QUESTION_LIKE_RE = re.compile(r'[TGE][0-9]|(?:^|(?<=~))\s*[A-D]\.',
+                              re.MULTILINE)
+
+# The wrapped question and choices returned by Question.layout().
+Layout = Tuple[str, dict[str, str]]
 
 class Question():
-    """A container to hold information about a single question."""
-    q_wrapper = textwrap.TextWrapper()
-    a_wrapper = textwrap.TextWrapper(initial_indent='   ',
-                                     subsequent_indent='      ')
+    """An immutable container to hold information about a single question.
+
+    Questions compare equal (and hash the same) when all their fields
+    are equal.
+    """
+    __slots__ = ('question_number', 'answer', 'regulation', 'question',
+                 'choice_a', 'choice_b', 'choice_c', 'choice_d')
+    question_number: str
+    answer: str
+    regulation: str
+    question: str
+    choice_a: str
+    choice_b: str
+    choice_c: str
+    choice_d: str
+
     all_choices_correct_re = re.compile('^All .* correct$')
 
-    def __init__(self, match_obj: re.Match[str]) -> None:
-        self.question_number = match_obj.group('QuestionNumber')
-        assert len(self.question_number)
-
-        self.answer = match_obj.group('Answer')
-        self.regulation = match_obj.group('Regulation')
-        self.question = ' '.join(match_obj.group('Question').split())
-        self.choices = {}
-        self.choices['A'] = ' '.join(match_obj.group('ChoiceA').split())
-        self.choices['B'] = ' '.join(match_obj.group('ChoiceB').split())
-        self.choices['C'] = ' '.join(match_obj.group('ChoiceC').split())
-        self.choices['D'] = ' '.join(match_obj.group('ChoiceD').split())
-
-        assert self.answer
-        if not self.regulation or self.regulation.isspace():
-            self.regulation = ''
-        assert self.question
-        for choice in self.choices.values():
-            assert choice
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 question_number: str,
+                 answer: str,
+                 regulation: Optional[str],
+                 question: str,
+                 choice_a: str,
+                 choice_b: str,
+                 choice_c: str,
+                 choice_d: str) -> None:
+        assert len(question_number)
+        assert answer
+        if not regulation or regulation.isspace():
+            regulation = ''
+        assert question
+        assert choice_a and choice_b and choice_c and choice_d
+
+        set_field = object.__setattr__
+        set_field(self, 'question_number', question_number)
+        set_field(self, 'answer', answer)
+        set_field(self, 'regulation', regulation)
+        set_field(self, 'question', question)
+        set_field(self, 'choice_a', choice_a)
+        set_field(self, 'choice_b', choice_b)
+        set_field(self, 'choice_c', choice_c)
+        set_field(self, 'choice_d', choice_d)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'Question is immutable: cannot set {name}')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'Question is immutable: cannot delete {name}')
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, ...]]:
+        return (Question, self.fields())
+
+    def fields(self) -> Tuple[str, ...]:
+        """Return the arguments that would recreate this Question."""
+        return (self.question_number, self.answer, self.regulation,
+                self.question, self.choice_a, self.choice_b,
+                self.choice_c, self.choice_d)
+
+    @property
+    def subelement(self) -> str:
+        """Return the subelement of the question (e.g. 'T1')."""
+        return self.question_number[:2]
+
+    @property
+    def group(self) -> str:
+        """Return the group of the question (e.g. 'T1A')."""
+        return self.question_number[:3]
+
+    @property
+    def choices(self) -> dict[str, str]:
+        """Return the text of each choice keyed by its letter."""
+        return {'A': self.choice_a, 'B': self.choice_b,
+                'C': self.choice_c, 'D': self.choice_d}
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the question as a dictionary suitable for JSON.
+
+        The regulation is given without the surrounding brackets.
+        """
+        return {'number': self.question_number,
+                'answer': self.answer,
+                'regulation': self.regulation.strip()[1:-1],
+                'question': self.question,
+                'choices': self.choices,
+                'subelement': self.subelement,
+                'group': self.group}
 
     def __str__(self) -> str:
         return (f'{self.question_number} ({self.answer}){self.regulation}\n'
                 f'{self.question}\n'
-                f'A. {self.choices["A"]}\n'
-                f'B. {self.choices["B"]}\n'
-                f'C. {self.choices["C"]}\n'
-                f'D. {self.choices["D"]}\n'
+                f'A. {self.choice_a}\n'
+                f'B. {self.choice_b}\n'
+                f'C. {self.choice_c}\n'
+                f'D. {self.choice_d}\n'
                 f'~~')
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Question):
             return NotImplemented
-        return str(self) == str(other)
+        return self.fields() == other.fields()
+
+    def __hash__(self) -> int:
+        return hash(self.fields())
 
-    def generate_question(self, shuffle_abcd: bool) -> Tuple[str, str]:
-        "Returns a string that asks the question."
+    def layout(self, width: int) -> Layout:
+        """Return the question and its choices wrapped to width.
+
+        The wrapped choices are keyed by their letter but each is
+        labelled "A." so that it can be relabelled after shuffling
+        without wrapping it again.
+        """
+        q_wrapper = textwrap.TextWrapper(width=width)
+        a_wrapper = textwrap.TextWrapper(width=width,
+                                         initial_indent='   ',
+                                         subsequent_indent='      ')
+        return ('\n'.join(q_wrapper.wrap(self.question)),
+                {letter: '\n'.join(a_wrapper.wrap(f'A. {text}'))
+                 for letter, text in self.choices.items()})
+
+    def generate_question(self,
+                          shuffle_abcd: bool,
+                          width: int = 70,
+                          layout: Optional[Layout] = None
+                          ) -> Tuple[str, str]:
+        """Returns a string that asks the question.
+
+        layout is what layout(width) returns, if it is already known.
+        """
 
         # Wrap the text of the question
-        question_text = '\n'.join(self.q_wrapper.wrap(self.question))
+        question_text, wrapped_choices = layout or self.layout(width)
 
         if not shuffle_abcd:
             # A is A, B is B, etc.
@@ -181,7 +609,7 @@ class Question():
                 'C': 'C',
                 'D': 'D'
             }
-        elif self.all_choices_correct_re.match(self.choices['D']):
+        elif self.all_choices_correct_re.match(self.choice_d):
             # Leave "All choices are correct" as D, but shuffle A, B and C.
             shuffled_choices = random.sample('ABC', 3)
             choice_lookup = {
@@ -200,12 +628,12 @@ class Question():
                 'D': shuffled_choices[3]
             }
 
+        # Every label is the same width so relabelling a wrapped choice
+        # does not change how it wraps.
         choices = {}
-        for original_choice in choice_lookup:
-            raw_text = (f'{choice_lookup[original_choice]}. '
-                        f'{self.choices[original_choice]}')
-            choices[choice_lookup[original_choice]] = (
-                '\n'.join(self.a_wrapper.wrap(raw_text)))
+        for original_choice, new_choice in choice_lookup.items():
+            wrapped = wrapped_choices[original_choice]
+            choices[new_choice] = wrapped[:3] + new_choice + wrapped[4:]
 
         return (choice_lookup[self.answer], (f'{self.question_number}\n'
                                              f'{question_text}\n'
@@ -224,38 +652,934 @@ def text_matches_any_re(text: str, regex_list: list[Pattern[str]]) -> bool:
             return True
     return False
 
+def make_any_re_matcher(re_strs: List[str]) -> Callable[[str], bool]:
+    """Return a function that tells whether text matches any of re_strs.
+
+    Like text_matches_any_re(), the regular expressions only need to
+    match the beginning of text.  The returned function does about the
+    same amount of work however many re_strs there are: literal strings
+    (e.g. question numbers) are looked up as prefixes in a set and the
+    rest are combined into a single alternation.
+    """
+    prefixes = {re_str for re_str in re_strs if re.escape(re_str) == re_str}
+    lengths = sorted({len(prefix) for prefix in prefixes})
+    def matches_prefix(text: str) -> bool:
+        return any(text[:length] in prefixes for length in lengths)
+
+    regex_list = [re.compile(re_str)
+                  for re_str in re_strs if re_str not in prefixes]
+    if not regex_list:
+        return matches_prefix
+
+    # Groups would be renumbered by combining the regular expressions,
+    # which would break any backreferences.
+    if not any(regex.groups for regex in regex_list):
+        try:
+            regex = re.compile('|'.join(f'(?:{regex.pattern})'
+                                        for regex in regex_list))
+        except re.error:
+            # e.g. global flags which must be at the start of a pattern
+            pass
+        else:
+            return lambda text: (matches_prefix(text) or
+                                 regex.match(text) is not None)
+    return lambda text: (matches_prefix(text) or
+                         text_matches_any_re(text, regex_list))
+
+def read_re_file(filename: str) -> List[str]:
+    """Return the regular expressions listed in the passed filename.
+
+    There is one regular expression (often just a question number) per
+    line.  Blank lines and lines starting with '#' are ignored.
+    """
+    with open(filename, encoding='utf-8') as re_file:
+        return [line.strip() for line in re_file
+                if line.strip() and not line.lstrip().startswith('#')]
+
+class QuestionFilter(): # pylint: disable=too-few-public-methods
+    """A callable that tells whether a question number is wanted.
+
+    If include_strs is not None, only question numbers matching one of its
+    regular expressions are wanted.  Otherwise, if exclude_strs is not None,
+    question numbers matching one of its regular expressions are not
+    wanted.  The regular expressions are kept so that the filter can also
+    be applied by other means (e.g. in SQL).
+    """
+    def __init__(self,
+                 include_strs: Optional[List[str]],
+                 exclude_strs: Optional[List[str]]) -> None:
+        self.include_strs = include_strs
+        self.exclude_strs = exclude_strs
+        self.is_wanted: Callable[[str], bool]
+        if include_strs is not None:
+            self.is_wanted = make_any_re_matcher(include_strs)
+        elif exclude_strs is not None:
+            matches_exclude = make_any_re_matcher(exclude_strs)
+            self.is_wanted = lambda key: not matches_exclude(key)
+        else:
+            self.is_wanted = lambda key: True
+
+    def __call__(self, key: str) -> bool:
+        return self.is_wanted(key)
+
+def split_question(block: str, question_start: int) -> Optional[List[str]]:
+    """Return the question and choice texts from block or None.
+
+    The question text starts at question_start and each part must be
+    at least one character long.  Each part ends at the first of its
+    CHOICE_MARKERS that allows that and the last choice runs to the end
+    of block.  Since every search starts where the previous one ended,
+    this takes time linear in the length of block.
+    """
+    texts = []
+    text_start = question_start
+    for marker in CHOICE_MARKERS:
+        marker_index = block.find(marker, text_start + 1)
+        if marker_index < 0:
+            return None
+        texts.append(block[text_start:marker_index])
+        text_start = marker_index + len(marker)
+    if text_start >= len(block):
+        return None
+    texts.append(block[text_start:])
+    return texts
+
+def parse_question(block: str, source: str, offset: int) -> Optional[Question]:
+    """Return the Question in block or None if it is malformed.
+
+    block runs from the start of a question (as matched by
+    QUESTION_START_RE) up to the next '~' and offset is where it starts
+    in source.  A message is printed to stderr if it is malformed.
+    """
+    start_obj = QUESTION_START_RE.match(block)
+    assert start_obj
+    question_number = start_obj.group('QuestionNumber')
+
+    # Choosing the earliest markers means that if the question cannot be
+    # split after its start, it could not be split after any later
+    # QUESTION_START_RE match before the '~' either.
+    regulation = ''
+    texts = None
+    regulation_obj = REGULATION_RE.match(block, start_obj.end())
+    if regulation_obj:
+        texts = split_question(block, regulation_obj.end())
+        if texts is not None:
+            regulation = regulation_obj.group()
+    if texts is None:
+        texts = split_question(block, start_obj.end())
+    if texts is None:
+        print(f'{source}: malformed question {question_number} '
+              f'at offset {offset}', file=sys.stderr)
+        return None
+
+    texts = [' '.join(text.split()) for text in texts]
+    if not all(texts):
+        print(f'{source}: empty text in question {question_number} '
+              f'at offset {offset}', file=sys.stderr)
+        return None
+    return Question(question_number, start_obj.group('Answer'), regulation,
+                    *texts)
+
+def iter_questions(chunks: Iterable[str],
+                   source: str = '<text>',
+                   is_wanted: Optional[Callable[[str], bool]] = None,
+                   offset: int = 0) -> Iterator[Question]:
+    """Yield the Questions in the text of chunks as each one is completed.
+
+    Only the text after the last '~' seen so far is kept between chunks.
+    If is_wanted is given, only the questions whose numbers it accepts
+    are parsed beyond their numbers.  Malformed questions are reported
+    to stderr with their offset in the text (plus offset), using source
+    as the name of the text.
+    """
+    # The chunks since the last one containing a '~'.
+    pending: List[str] = []
+    for chunk in chunks:
+        # A question always ends with a '~' and cannot contain one, so
+        # all the text up to the last '~' can be parsed now.  Only the
+        # new chunk is searched so that a long run of chunks without a
+        # '~' does not take quadratic time.
+        chunk_end = chunk.rfind('~') + 1
+        pending.append(chunk)
+        if not chunk_end:
+            continue
+        text = ''.join(pending)
+        end = len(text) - len(chunk) + chunk_end
+        block_start = 0
+        while block_start < end:
+            block_end = text.index('~', block_start)
+            start_obj = QUESTION_START_RE.search(text, block_start, block_end)
+            if not start_obj:
+                if QUESTION_LIKE_RE.search(text, block_start, block_end):
+                    print(f'{source}: malformed question at offset '
+                          f'{offset + block_start}', file=sys.stderr)
+            elif is_wanted is None or is_wanted(
+                    start_obj.group('QuestionNumber')):
+                question = parse_question(
+                    text[start_obj.start():block_end], source,
+                    offset + start_obj.start())
+                if question:
+                    yield question
+            block_start = block_end + 1
+        pending = [text[end:]]
+        offset += end
+
+FIRST_QUESTION_BYTES = tuple(number.encode()
+                             for number in FIRST_QUESTION_NUMBERS)
+QUESTION_START_BYTES_RE = re.compile(QUESTION_START_RE.pattern.encode())
+QUESTION_LIKE_BYTES_RE = re.compile(QUESTION_LIKE_RE.pattern.encode(),
+                                    re.MULTILINE)
+NON_ASCII_BYTES_RE = re.compile(rb'[\x80-\xFF]')
+
+def iter_mapped_questions(filename: str,
+                          is_wanted: Optional[Callable[[str], bool]] = None
+                          ) -> Iterator[Question]:
+    """Yield the Questions in the passed .txt filename.
+
+    This gives the same Questions as iter_questions() on the text from
+    iter_file_text(), but the file is memory-mapped and the questions
+    are found in the mapped bytes.  Only the blocks of wanted questions
+    are copied out and decoded.  Malformed questions are reported with
+    their offset in the file.
+    """
+    with open(filename, 'rb') as text_file:
+        if not os.fstat(text_file.fileno()).st_size:
+            return
+        with mmap.mmap(text_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b'\xFF') >= 0:
+                # Leave removing the extraneous '\xFF's to the text path.
+                yield from iter_questions(
+                    iter_file_text(filename, extractor=get_text_from_txt),
+                    filename, is_wanted)
+                return
+
+            block_start = max(0, *(mapped.rfind(number)
+                                   for number in FIRST_QUESTION_BYTES))
+            block_end = mapped.find(b'~', block_start)
+            while block_end >= 0:
+                if NON_ASCII_BYTES_RE.search(mapped, block_start, block_end):
+                    # Transliterating could change the structure of the
+                    # block so clean all of it and parse it as text.
+                    text = transliterate(
+                        mapped[block_start:block_end].decode())
+                    yield from iter_questions(
+                        [EXTRA_SPACE_RE.sub(r'\1\2', text) + '~'], filename,
+                        is_wanted, block_start)
+                else:
+                    start_obj = QUESTION_START_BYTES_RE.search(
+                        mapped, block_start, block_end)
+                    if not start_obj:
+                        if QUESTION_LIKE_BYTES_RE.search(mapped, block_start,
+                                                         block_end):
+                            print(f'{filename}: malformed question at offset '
+                                  f'{block_start}', file=sys.stderr)
+                    elif is_wanted is None or is_wanted(
+                            start_obj.group('QuestionNumber').decode('ascii')):
+                        text = mapped[start_obj.start():block_end].decode(
+                            'ascii')
+                        question = parse_question(
+                            EXTRA_SPACE_RE.sub(r'\1\2', text), filename,
+                            start_obj.start())
+                        if question:
+                            yield question
+                block_start = block_end + 1
+                block_end = mapped.find(b'~', block_start)
+
+def iter_parsed_questions(filename: str,
+                          jobs: int = 1,
+                          is_wanted: Optional[Callable[[str], bool]] = None,
+                          extractor: Optional[Extractor] = None
+                          ) -> Iterator[Question]:
+    """Yield the Questions extracted and parsed from filename in order.
+
+    See iter_questions() for the meaning of is_wanted and
+    iter_file_text() for jobs and extractor.
+    """
+    if extractor is None:
+        extractor = get_file_type(filename).extractor
+    if extractor is get_text_from_txt:
+        questions = iter_mapped_questions(filename, is_wanted)
+    else:
+        questions = iter_questions(iter_file_text(filename, jobs, extractor),
+                                   filename, is_wanted)
+    return iter(profiled(filename, 'parse', questions))
+
+def iter_wanted_questions(questions: Iterable[Question],
+                          is_wanted: Callable[[str], bool]
+                          ) -> Iterator[Question]:
+    """Yield the questions whose numbers are wanted, dropping repeats.
+
+    TwoQuestionsWithSameNumber is raised if a question differs from an
+    earlier one with the same number.  Only a hash of each question is
+    remembered so memory does not grow with the size of the questions.
+    """
+    seen: dict[str, int] = {}
+    for question in questions:
+        key = question.question_number
+        if not is_wanted(key):
+            continue
+        question_hash = hash(question)
+        if key in seen:
+            if seen[key] != question_hash:
+                raise TwoQuestionsWithSameNumber(key)
+            continue
+        seen[key] = question_hash
+        yield question
+
 def parse_questions(text: str,
-                    include_strs: str,
-                    exclude_strs: str) -> dict[str, Question]:
+                    include_strs: Optional[List[str]],
+                    exclude_strs: Optional[List[str]]) -> dict[str, Question]:
     """Returns a dictionary of Questions extracted from text.
 
     The dictionary's keys are the question numbers in the order they
     occurred in text.
     """
-
-    if include_strs:
-        regex_list = [re.compile(re_str) for re_str in include_strs]
-    elif exclude_strs:
-        regex_list = [re.compile(re_str) for re_str in exclude_strs]
+    is_wanted = QuestionFilter(include_strs, exclude_strs)
 
     questions: dict[str, Question] = {}
-    for match_obj in QA_RE.finditer(text):
-        key = match_obj.group('QuestionNumber')
-
-        if include_strs:
-            if not text_matches_any_re(key, regex_list):
-                continue
-
-        elif exclude_strs:
-            if text_matches_any_re(key, regex_list):
-                continue
-
-        question = Question(match_obj)
+    for question in iter_questions([text], is_wanted=is_wanted):
+        key = question.question_number
         if key in questions and question != questions[key]:
             raise TwoQuestionsWithSameNumber(key)
         questions[key] = question
     return questions
 
+# Increment whenever a change to the extraction or parsing code could
+# change the Questions produced from a file so stale cache entries are
+# not used.
+PARSER_VERSION = 3
+
+def get_cache_dir() -> str:
+    """Return the directory used to cache the parsed question pools."""
+    cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                  os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'parse_arrl_pool')
+
+def get_cache_filename(filename: str) -> str:
+    """Return the name of the cache file for the passed pool filename.
+
+    The name is derived from a hash of the file's contents and
+    PARSER_VERSION so renamed files still hit the cache and edited
+    files (or a newer parser) miss it.
+    """
+    hasher = hashlib.sha256(f'{PARSER_VERSION}\n'.encode())
+    with open(filename, 'rb') as pool_file:
+        for block in iter(lambda: pool_file.read(1 << 20), b''):
+            hasher.update(block)
+    return os.path.join(get_cache_dir(), hasher.hexdigest() + '.jsonl')
+
+def iter_cached_questions(cache_filename: str,
+                          is_wanted: Optional[Callable[[str], bool]] = None
+                          ) -> Iterator[Question]:
+    """Yield the Questions stored in cache_filename.
+
+    If is_wanted is given, only the questions whose numbers it accepts
+    are yielded.  OSError is raised if there is no such cache file.
+    """
+    with open(cache_filename, encoding='utf-8') as cache_file:
+        for line in cache_file:
+            fields = json.loads(line)
+            if is_wanted is None or is_wanted(fields[0]):
+                yield Question(*fields)
+
+def discard_temp_file(temp_file: IO[str]) -> None:
+    """Close and remove the passed temporary file, ignoring errors."""
+    try:
+        temp_file.close()
+        os.remove(temp_file.name)
+    except OSError:
+        pass
+
+def iter_caching_questions(questions: Iterable[Question],
+                           cache_filename: str) -> Iterator[Question]:
+    """Yield questions while also storing them in cache_filename.
+
+    The cache file is only put in place once all of the questions have
+    been yielded.  The cache is only an optimization so failures to
+    write it are silently ignored.
+    """
+    temp_file: Optional[IO[str]]
+    try:
+        os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
+        temp_file = tempfile.NamedTemporaryFile( # pylint: disable=consider-using-with
+            'w', encoding='utf-8', dir=os.path.dirname(cache_filename),
+            delete=False)
+    except OSError:
+        temp_file = None
+
+    try:
+        for question in questions:
+            if temp_file:
+                try:
+                    temp_file.write(json.dumps(question.fields()) + '\n')
+                except OSError:
+                    discard_temp_file(temp_file)
+                    temp_file = None
+            yield question
+        if temp_file:
+            temp_file.close()
+            os.replace(temp_file.name, cache_filename)
+            temp_file = None
+    except OSError:
+        pass
+    finally:
+        if temp_file:
+            discard_temp_file(temp_file)
+
+# A compiled pool starts with a header giving the number of questions
+# followed by a fixed-size index entry for each question and then a
+# table of the questions' UTF-8 strings.  Each index entry holds the
+# question number, the answer and the offsets into the string table of
+# the regulation, question and choices with a final offset for the end
+# of the last choice.
+POOL_MAGIC = b'ARRLPOOL'
+POOL_VERSION = 1
+POOL_HEADER = struct.Struct('<8sII')
+POOL_ENTRY = struct.Struct('<5s1s7I')
+
+class BadCompiledPool(Exception):
+    """Signal that a compiled pool file cannot be read."""
+
+def write_compiled_pool(questions: Iterable[Question],
+                        output_file: BinaryIO) -> Tuple[int, int]:
+    """Write questions to output_file as a compiled pool.
+
+    How many questions and bytes were written is returned.
+    """
+    index = []
+    strings = []
+    offset = 0
+    for question in questions:
+        number, answer, *texts = question.fields()
+        offsets = []
+        for text in texts:
+            offsets.append(offset)
+            encoded = text.encode()
+            strings.append(encoded)
+            offset += len(encoded)
+        offsets.append(offset)
+        number_bytes = number.encode('ascii')
+        answer_bytes = answer.encode('ascii')
+        if len(number_bytes) != 5 or len(answer_bytes) != 1:
+            raise ValueError(f'cannot compile question {number}')
+        index.append(POOL_ENTRY.pack(number_bytes, answer_bytes, *offsets))
+    output_file.write(POOL_HEADER.pack(POOL_MAGIC, POOL_VERSION, len(index)))
+    output_file.write(b''.join(index))
+    output_file.write(b''.join(strings))
+    return len(index), POOL_HEADER.size + len(index) * POOL_ENTRY.size + offset
+
+def iter_compiled_questions(filename: str,
+                            is_wanted: Optional[Callable[[str], bool]] = None
+                            ) -> Iterator[Question]:
+    """Yield the Questions in the compiled pool filename in order.
+
+    The file is memory-mapped and only the strings of the questions
+    whose numbers is_wanted accepts are decoded.  BadCompiledPool is
+    raised if the file is not a compiled pool this version can read.
+    """
+    with open(filename, 'rb') as pool_file, \
+         mmap.mmap(pool_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        try:
+            magic, version, count = POOL_HEADER.unpack_from(mapped)
+        except struct.error as err:
+            raise BadCompiledPool(filename) from err
+        strings_start = POOL_HEADER.size + count * POOL_ENTRY.size
+        if (magic != POOL_MAGIC or version != POOL_VERSION or
+                strings_start > len(mapped)):
+            raise BadCompiledPool(filename)
+        for entry_start in range(POOL_HEADER.size, strings_start,
+                                 POOL_ENTRY.size):
+            number_bytes, answer_bytes, *offsets = POOL_ENTRY.unpack_from(
+                mapped, entry_start)
+            number = number_bytes.decode('ascii')
+            if is_wanted is not None and not is_wanted(number):
+                continue
+            if strings_start + offsets[-1] > len(mapped):
+                raise BadCompiledPool(filename)
+            yield Question(number, answer_bytes.decode('ascii'),
+                           *(mapped[strings_start + start:
+                                    strings_start + end].decode()
+                             for start, end in zip(offsets, offsets[1:])))
+
+SQLITE_MAGIC = b'SQLite format 3\x00'
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    position INTEGER PRIMARY KEY,
+    number TEXT NOT NULL UNIQUE,
+    subelement TEXT NOT NULL,
+    question_group TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    regulation TEXT NOT NULL,
+    question TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS choices (
+    number TEXT NOT NULL REFERENCES questions (number),
+    letter TEXT NOT NULL,
+    choice TEXT NOT NULL,
+    PRIMARY KEY (number, letter)
+);
+CREATE INDEX IF NOT EXISTS questions_subelement ON questions (subelement);
+CREATE INDEX IF NOT EXISTS questions_group ON questions (question_group);
+CREATE INDEX IF NOT EXISTS questions_regulation ON questions (regulation);
+"""
+SQLITE_SELECT = """
+SELECT q.number, q.answer, q.regulation, q.question,
+       a.choice, b.choice, c.choice, d.choice
+FROM questions AS q
+JOIN choices AS a ON a.number = q.number AND a.letter = 'A'
+JOIN choices AS b ON b.number = q.number AND b.letter = 'B'
+JOIN choices AS c ON c.number = q.number AND c.letter = 'C'
+JOIN choices AS d ON d.number = q.number AND d.letter = 'D'
+WHERE {}
+ORDER BY q.position
+"""
+
+def write_sqlite_pool(questions: Iterable[Question],
+                      filename: str) -> Tuple[int, int]:
+    """Write questions to the SQLite database filename.
+
+    Any questions already in the database are replaced.  How many
+    questions and characters of their text were written is returned.
+    """
+    import sqlite3
+    count = 0
+    size = 0
+    with contextlib.closing(sqlite3.connect(filename)) as connection:
+        connection.executescript(SQLITE_SCHEMA)
+        with connection:
+            connection.execute('DELETE FROM choices')
+            connection.execute('DELETE FROM questions')
+            for question in questions:
+                connection.execute(
+                    'INSERT INTO questions (number, subelement, '
+                    'question_group, answer, regulation, question) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (question.question_number, question.subelement,
+                     question.group, question.answer, question.regulation,
+                     question.question))
+                connection.executemany(
+                    'INSERT INTO choices (number, letter, choice) '
+                    'VALUES (?, ?, ?)',
+                    ((question.question_number, letter, choice)
+                     for letter, choice in question.choices.items()))
+                count += 1
+                size += get_size(question)
+    return count, size
+
+# The most regular expressions that are applied in SQL.  Each adds a
+# level to the expression tree, which SQLite limits to a depth of 1000,
+# so longer lists (e.g. from -I) are applied by calling is_wanted.
+SQLITE_MAX_RE_TERMS = 100
+
+def make_sql_re_condition(re_strs: List[str]) -> Tuple[str, List[str]]:
+    """Return SQL that tells whether q.number matches any of re_strs.
+
+    The parameters for the SQL are returned with it.  Literal strings
+    are matched as prefixes with GLOB so the index on the numbers can be
+    used.  The rest need the REGEXP function that iter_sqlite_questions()
+    defines.
+    """
+    terms = []
+    params = []
+    for re_str in re_strs:
+        if re.escape(re_str) == re_str:
+            terms.append('q.number GLOB ?')
+            params.append(re_str + '*')
+        else:
+            terms.append('q.number REGEXP ?')
+            params.append(re_str)
+    if not terms:
+        return '0', params
+    return '(' + ' OR '.join(terms) + ')', params
+
+def iter_sqlite_questions(filename: str,
+                          is_wanted: Optional[Callable[[str], bool]] = None
+                          ) -> Iterator[Question]:
+    """Yield the Questions in the SQLite database filename in order.
+
+    If is_wanted is a QuestionFilter with up to SQLITE_MAX_RE_TERMS
+    regular expressions, they are applied in the query's WHERE clause.
+    Any other is_wanted is called from the query for each question
+    number.
+    """
+    import pathlib
+    import sqlite3
+    uri = pathlib.Path(os.path.abspath(filename)).as_uri() + '?mode=ro'
+    with contextlib.closing(sqlite3.connect(uri, uri=True)) as connection:
+        connection.create_function(
+            'regexp', 2,
+            lambda re_str, text: re.match(re_str, text) is not None,
+            deterministic=True)
+        condition = '1'
+        params: List[str] = []
+        if (isinstance(is_wanted, QuestionFilter) and
+                len(is_wanted.include_strs or is_wanted.exclude_strs or [])
+                <= SQLITE_MAX_RE_TERMS):
+            if is_wanted.include_strs is not None:
+                condition, params = make_sql_re_condition(
+                    is_wanted.include_strs)
+            elif is_wanted.exclude_strs is not None:
+                condition, params = make_sql_re_condition(
+                    is_wanted.exclude_strs)
+                condition = 'NOT ' + condition
+        elif is_wanted is not None:
+            connection.create_function('is_wanted', 1, is_wanted)
+            condition = 'is_wanted(q.number)'
+        for fields in connection.execute(SQLITE_SELECT.format(condition),
+                                         params):
+            yield Question(*fields)
+
+# A loader is passed a filename and an optional is_wanted function and
+# yields the already parsed Questions stored in the file.
+Loader = Callable[[str, Optional[Callable[[str], bool]]], Iterator[Question]]
+
+class FileType(): # pylint: disable=too-few-public-methods
+    """How to get the Questions from one type of pool file.
+
+    Either extractor gets the text of the file to be parsed or loader
+    yields the already parsed Questions stored in it.
+    """
+    __slots__ = ('extractor', 'loader')
+
+    def __init__(self,
+                 extractor: Optional[Extractor] = None,
+                 loader: Optional[Loader] = None) -> None:
+        assert (extractor is None) != (loader is None)
+        self.extractor = extractor
+        self.loader = loader
+
+# The types of files starting with particular magic bytes.  Files that
+# match none of them are treated as text.
+FILE_TYPES: List[Tuple[bytes, FileType]] = []
+TEXT_FILE_TYPE = FileType(extractor=get_text_from_txt)
+
+def register_extractor(magic: bytes, extractor: Extractor) -> None:
+    """Use extractor to get the text of files that start with magic."""
+    FILE_TYPES.append((magic, FileType(extractor=extractor)))
+
+def register_loader(magic: bytes, loader: Loader) -> None:
+    """Use loader to get the Questions in files that start with magic."""
+    FILE_TYPES.append((magic, FileType(loader=loader)))
+
+register_extractor(b'%PDF-', get_text_from_pdf)
+register_extractor(b'PK\x03\x04', get_text_from_docx)
+register_loader(POOL_MAGIC, iter_compiled_questions)
+register_loader(SQLITE_MAGIC, iter_sqlite_questions)
+
+def get_file_type(filename: str) -> FileType:
+    """Return the type of filename based on its first few bytes."""
+    with open(filename, 'rb') as pool_file:
+        head = pool_file.read(max(len(magic) for magic, _ in FILE_TYPES))
+    for magic, file_type in FILE_TYPES:
+        if head.startswith(magic):
+            return file_type
+    return TEXT_FILE_TYPE
+
+def iter_file_questions(filename: str,
+                        use_cache: bool = True,
+                        jobs: int = 1,
+                        is_wanted: Optional[Callable[[str], bool]] = None
+                        ) -> Iterator[Question]:
+    """Yield the Questions in filename in order.
+
+    If use_cache is True, the parsed Questions are looked up in (and
+    saved to) the cache in get_cache_dir() so that a file only needs to
+    be extracted and parsed once.  Up to jobs processes are used to
+    extract the file.  If is_wanted is given, only the questions whose
+    numbers it accepts are yielded.  Unless the whole file is needed to
+    fill the cache, the rest are skipped without being fully parsed.
+    Compiled pools and SQLite databases are loaded directly and never
+    cached.
+    """
+    file_type = get_file_type(filename)
+    if file_type.loader:
+        yield from profiled(filename, 'load',
+                            file_type.loader(filename, is_wanted))
+        return
+    if not use_cache:
+        yield from iter_parsed_questions(filename, jobs, is_wanted,
+                                         file_type.extractor)
+        return
+
+    with profiled_section(filename, 'cache'):
+        cache_filename = get_cache_filename(filename)
+    try:
+        yield from profiled(filename, 'cache',
+                            iter_cached_questions(cache_filename, is_wanted))
+        return
+    except (OSError, ValueError, TypeError, AssertionError):
+        # Fall back to parsing the file.  Any questions already yielded
+        # from a damaged cache file will be yielded again, which
+        # iter_wanted_questions() tolerates.
+        pass
+    for question in profiled(filename, 'cache', iter_caching_questions(
+            iter_parsed_questions(filename, jobs,
+                                  extractor=file_type.extractor),
+            cache_filename)):
+        if is_wanted is None or is_wanted(question.question_number):
+            yield question
+
+def get_questions_from_file(filename: str,
+                            use_cache: bool = True,
+                            jobs: int = 1) -> List[Question]:
+    """Return a list of all the Questions in filename in order.
+
+    See iter_file_questions() for the meaning of the arguments.
+    """
+    return list(iter_file_questions(filename, use_cache, jobs))
+
+def get_profiled_questions_from_file(
+        filename: str,
+        use_cache: bool = True,
+        profile: bool = False
+        ) -> Tuple[List[Question], dict[Tuple[str, str], StageStats]]:
+    """Return the Questions in filename and what was profiled getting them.
+
+    This is run in worker processes.  If profile is True, a new Profiler
+    records each stage of filename so that its stats can be merged into
+    the PROFILER of the main process.  Otherwise, no stats are returned.
+    """
+    global PROFILER # pylint: disable=global-statement
+    PROFILER = Profiler() if profile else None
+    questions = get_questions_from_file(filename, use_cache)
+    return questions, PROFILER.stats if PROFILER else {}
+
+def iter_pool_questions(filenames: List[str],
+                        use_cache: bool = True,
+                        jobs: int = 1,
+                        is_wanted: Optional[Callable[[str], bool]] = None
+                        ) -> Iterator[Question]:
+    """Yield the Questions in filenames in order.
+
+    If jobs is greater than one, the files are extracted and parsed by
+    up to that many worker processes.  A single file is instead split
+    up (e.g. by page) if its extractor supports that.  Otherwise, each
+    Question is yielded as soon as it has been parsed.  If is_wanted is
+    given, only the questions whose numbers it accepts are yielded.
+    When profiling, what the workers record is merged into PROFILER.
+    """
+    if jobs > 1 and len(filenames) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(jobs, len(filenames))) as executor:
+            for file_questions, stats in profiled(
+                    '(all)', 'workers',
+                    executor.map(get_profiled_questions_from_file, filenames,
+                                 itertools.repeat(use_cache),
+                                 itertools.repeat(PROFILER is not None))):
+                if PROFILER:
+                    PROFILER.merge(stats)
+                yield from (question for question in file_questions
+                            if is_wanted is None or
+                            is_wanted(question.question_number))
+    else:
+        for filename in filenames:
+            yield from iter_file_questions(filename, use_cache, jobs,
+                                           is_wanted)
+
+# Roughly how many characters of output to gather before writing them.
+OUTPUT_CHUNK_SIZE = 1 << 16
+
+def write_chunked(lines: Iterable[str],
+                  output_file: TextIO) -> Tuple[int, int]:
+    """Write lines to output_file in large chunks.
+
+    How many lines and characters were written is returned.
+
+    Each chunk is flushed as it is written so that it goes out in a
+    single write to the underlying file (e.g. a pipe) rather than being
+    split up by output_file's own buffering.
+    """
+    count = 0
+    total_size = 0
+    chunk: List[str] = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        count += 1
+        if size >= OUTPUT_CHUNK_SIZE:
+            output_file.write(''.join(chunk))
+            output_file.flush()
+            chunk.clear()
+            total_size += size
+            size = 0
+    output_file.write(''.join(chunk))
+    output_file.flush()
+    return count, total_size + size
+
+def write_questions(questions: Iterable[Question],
+                    output_file: TextIO) -> Tuple[int, int]:
+    """Write questions to output_file as text.
+
+    How many questions and characters were written is returned.
+    """
+    return write_chunked((f'{question}\n' for question in questions),
+                         output_file)
+
+def write_questions_jsonl(questions: Iterable[Question],
+                          output_file: TextIO) -> Tuple[int, int]:
+    """Write questions to output_file as JSON Lines.
+
+    How many questions and characters were written is returned.
+    """
+    return write_chunked((json.dumps(question.as_dict()) + '\n'
+                          for question in questions), output_file)
+
+# The functions that write the questions in each --format.
+WRITERS = {
+    'text': write_questions,
+    'jsonl': write_questions_jsonl,
+}
+
+class QuizSession(): # pylint: disable=too-many-instance-attributes
+    """The state of a quiz on some questions, independent of any UI.
+
+    The questions are asked in a random order.  Each question that is
+    answered correctly is deleted from the questions dictionary so that
+    the ones left are those still to be learned.  The questions are
+    wrapped to width and the wrapped text is cached in layouts, keyed by
+    question number and width, so that each question is only wrapped
+    once.  Sessions on the same questions may share layouts.  If
+    prefetch is greater than zero, that many of the following questions
+    are shuffled and wrapped by a background thread while each question
+    is being answered.  The thread waits for each question to be asked
+    rather than being started for each and is stopped by close().
+    """
+    def __init__(self,
+                 questions: dict[str, Question],
+                 shuffle_abcd: bool,
+                 width: int = 70,
+                 prefetch: int = 0,
+                 layouts: Optional[dict[Tuple[str, int], Layout]] = None
+                 ) -> None:
+        self.questions = questions
+        self.shuffle_abcd = shuffle_abcd
+        self.width = width
+        self.layouts = {} if layouts is None else layouts
+        self.prefetch = prefetch
+        # The correct answer and text of prefetched questions keyed by
+        # their position in order.
+        self.prepared: dict[int, Tuple[str, str]] = {}
+        self.prepared_changed = threading.Condition()
+        self.prefetcher: Optional[threading.Thread] = None
+        self.closed = False
+        self.order = random.sample(list(questions), len(questions))
+        self.position = 0
+        self.correct = 0
+        self.incorrect = 0
+        self.skipped = 0
+        self.question_number: Optional[str] = None
+        self.correct_answer = ''
+        self.question_text = ''
+
+    def next_question(self) -> Optional[str]:
+        """Return the text of the question to ask or None if there are none.
+
+        The same question is returned until it has been answered.
+        """
+        if self.question_number is None:
+            if self.position >= len(self.order):
+                return None
+            self.question_number = self.order[self.position]
+            with self.prepared_changed:
+                prepared = self.prepared.pop(self.position, None)
+                self.position += 1
+                self.prepared_changed.notify()
+            if prepared is None:
+                prepared = self.prepare(self.questions[self.question_number])
+            self.correct_answer, self.question_text = prepared
+            if self.prefetch > 0 and not self.prefetcher:
+                self.prefetcher = threading.Thread(
+                    target=self.prefetch_questions, daemon=True)
+                self.prefetcher.start()
+        return self.question_text
+
+    def prepare(self, question: Question) -> Tuple[str, str]:
+        """Return the correct answer and text for asking question."""
+        key = (question.question_number, self.width)
+        layout = self.layouts.get(key)
+        if layout is None:
+            layout = self.layouts[key] = question.layout(self.width)
+        return question.generate_question(self.shuffle_abcd, self.width,
+                                          layout)
+
+    def get_prefetch_position(self) -> Optional[int]:
+        """Return the position of the next question to prefetch, if any.
+
+        prepared_changed must be held.
+        """
+        for position in range(self.position,
+                              min(self.position + self.prefetch,
+                                  len(self.order))):
+            if position not in self.prepared:
+                return position
+        return None
+
+    def prefetch_questions(self) -> None:
+        """Keep the questions following the one being asked prepared.
+
+        Only questions after the one being asked are prepared.  Each is
+        looked up in questions while prepared_changed is held, as it
+        cannot have been asked (and deleted by answer()) until then, and
+        is prepared from the Question itself.  This returns once all of
+        the questions have been asked or the session is closed.
+        """
+        while True:
+            with self.prepared_changed:
+                position = self.get_prefetch_position()
+                while position is None:
+                    if self.closed or self.position >= len(self.order):
+                        return
+                    self.prepared_changed.wait()
+                    position = self.get_prefetch_position()
+                question = self.questions[self.order[position]]
+            prepared = self.prepare(question)
+            with self.prepared_changed:
+                if self.closed:
+                    return
+                # Drop it if the question has been asked meanwhile.
+                if position >= self.position:
+                    self.prepared[position] = prepared
+
+    def close(self) -> None:
+        """Stop prefetching questions."""
+        with self.prepared_changed:
+            self.closed = True
+            self.prepared_changed.notify()
+
+    def answer(self, letter: str) -> bool:
+        """Answer the current question and return whether it was correct.
+
+        letter is the letter of one of the choices as shown or 'S' to
+        skip the question.  Afterwards, correct_answer still holds the
+        letter of the correct choice.
+        """
+        if self.question_number is None:
+            raise ValueError('no question has been asked')
+        letter = letter.upper()
+        if letter not in ('A', 'B', 'C', 'D', 'S'):
+            raise ValueError(f'invalid answer {letter!r}')
+        is_correct = letter == self.correct_answer
+        if is_correct:
+            self.correct += 1
+            del self.questions[self.question_number]
+        elif letter == 'S':
+            self.skipped += 1
+        else:
+            self.incorrect += 1
+        self.question_number = None
+        return is_correct
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of questions in total, answered, etc."""
+        return {'total': len(self.order),
+                'correct': self.correct,
+                'incorrect': self.incorrect,
+                'skipped': self.skipped,
+                'remaining': (len(self.order) - self.correct -
+                              self.incorrect - self.skipped)}
+
 ASK_QUESTIONS_HELP = (
     '\n' +
     '\n'.join(textwrap.wrap('Press the letter of your answer '
@@ -267,6 +1591,12 @@ ASK_QUESTIONS_HELP = (
                             'questions will be immediately output.')) +
     '\n')
 
+# How many questions ask_questions() prepares ahead of the one asked.
+QUIZ_PREFETCH_QUESTIONS = 3
+# The number of rows used by the scores above the questions.
+QUIZ_HEADER_ROWS = 6
+QUIZ_PROMPT = '[abcdsq?]: '
+
 class WinTooSmallError(Exception):
     """Signal that the terminal window is too small."""
 
@@ -275,59 +1605,119 @@ def ask_questions(stdscr: Window,
                   shuffle_abcd: bool) -> None:
     """Use curses to test the user.
 
-    Any questions answered correctly will not be output.
+    Any questions answered correctly will not be output.  The screen is
+    split into windows for the scores, the question and the prompt that
+    are only redrawn where they change, rather than clearing the whole
+    screen for each question.  The prompt window is put directly below
+    the question and fills the rows that are left.  The help and the
+    correct answer are cut short if they do not fit in it.
     """
-
+    import curses
     curses.use_default_colors()
     stdscr.clear()
 
     rows, cols = stdscr.getmaxyx()
     if rows < 24 or cols < 80:
         raise WinTooSmallError
+    stdscr.noutrefresh()
+
+    header_win = stdscr.derwin(QUIZ_HEADER_ROWS, cols, 0, 0)
+    question_win = stdscr.derwin(rows - QUIZ_HEADER_ROWS, cols,
+                                 QUIZ_HEADER_ROWS, 0)
+    # The prompt follows a blank line after the question, so the
+    # prompt window needs at least two rows.
+    min_prompt_rows = 2
 
-    q_correct = 0
-    q_incorrect = 0
-    q_skipped = 0
-    q_numbers = list(questions.keys())
-    q_numbers = random.sample(q_numbers, len(q_numbers))
-    for q_number in q_numbers:
-        question = questions[q_number]
-        stdscr.clear()
-
-        stdscr.addstr(f'       total questions: {len(q_numbers)}\n'
-                      f'    correctly answered: {q_correct}\n'
-                      f'  incorrectly answered: {q_incorrect}\n'
-                      f'               skipped: {q_skipped}\n'
-                      f'             remaining: '
-                      f'{len(q_numbers) - q_correct - q_incorrect - q_skipped}'
-                      f'\n\n')
-        correct_answer, question_text = question.generate_question(shuffle_abcd)
-        stdscr.addstr(question_text)
-
-        old_pos = stdscr.getyx()
+    session = QuizSession(questions, shuffle_abcd,
+                          prefetch=QUIZ_PREFETCH_QUESTIONS)
+    try:
         while True:
-            stdscr.addstr('\n[abcdsq?]: ')
-            their_answer = stdscr.getkey().upper()
-            if their_answer in 'ABCDSQ':
-                break
-            stdscr.addstr(ASK_QUESTIONS_HELP)
-            stdscr.move(*old_pos)
-
-        stdscr.clrtobot()
-        stdscr.addch(their_answer)
-        if their_answer == 'Q':
-            return
-        if their_answer == correct_answer:
-            q_correct += 1
-            del questions[q_number]
+            question_text = session.next_question()
+            if question_text is None:
+                return
+            stats = session.stats()
+
+            header_win.erase()
+            header_win.addstr(f'       total questions: {stats["total"]}\n'
+                              f'    correctly answered: {stats["correct"]}\n'
+                              f'  incorrectly answered: {stats["incorrect"]}\n'
+                              f'               skipped: {stats["skipped"]}\n'
+                              f'             remaining: {stats["remaining"]}')
+            question_win.erase()
+            question_win.addstr(question_text)
+            # Only a question that leaves no room for the prompt has its
+            # end covered by it.
+            prompt_top = min(QUIZ_HEADER_ROWS + question_text.count('\n'),
+                             rows - min_prompt_rows)
+            prompt_win = curses.newwin(rows - prompt_top, cols, prompt_top, 0)
+            prompt_win.keypad(True)
+            prompt_win.addstr(1, 0, QUIZ_PROMPT)
+            header_win.noutrefresh()
+            question_win.noutrefresh()
+            prompt_win.noutrefresh()
+            curses.doupdate()
+
+            while True:
+                their_answer = prompt_win.getkey().upper()
+                if len(their_answer) == 1 and their_answer in 'ABCDSQ':
+                    break
+                with contextlib.suppress(curses.error):
+                    prompt_win.addstr(ASK_QUESTIONS_HELP)
+                prompt_win.move(1, len(QUIZ_PROMPT))
+
+            prompt_win.clrtobot()
+            prompt_win.addch(their_answer)
+            if their_answer == 'Q':
+                return
+            if not session.answer(their_answer):
+                with contextlib.suppress(curses.error):
+                    prompt_win.addstr(f'\nThe correct answer is '
+                                      f'{session.correct_answer}.\n'
+                                      f'Press a key to continue.')
+                prompt_win.getkey()
+    finally:
+        session.close()
+
+def process_questions(args: argparse.Namespace) -> int:
+    """Read, filter, quiz on and output the questions as args says."""
+    is_wanted = QuestionFilter(args.include, args.exclude)
+    questions: Iterator[Question] = iter(profiled(
+        '(all)', 'filter', iter_wanted_questions(
+            iter_pool_questions(args.question_pools, not args.no_cache,
+                                args.jobs, is_wanted),
+            is_wanted)))
+
+    if args.shuffle_abcd:
+        args.ask_questions = True
+    if args.ask_questions:
+        question_dict = {question.question_number: question
+                         for question in questions}
+        import curses
+        try:
+            with profiled_section('(all)', 'quiz') as stats:
+                if stats is not None:
+                    stats.size += get_size(list(question_dict.values()))
+                curses.wrapper(ask_questions, question_dict,
+                               args.shuffle_abcd)
+        except WinTooSmallError:
+            print('The terminal window must be at least 80x24.',
+                  file=sys.stderr)
+            return 1
+        questions = iter(question_dict.values())
+
+    with profiled_section('(all)', 'output') as stats:
+        if args.compile:
+            count, size = write_compiled_pool(questions, args.compile)
+        elif args.sqlite:
+            count, size = write_sqlite_pool(questions, args.sqlite)
         else:
-            if their_answer == 'S':
-                q_skipped += 1
-            else:
-                q_incorrect += 1
-            stdscr.addstr(f'\nThe correct answer is {correct_answer}.\n'
-                          f'Press a key to continue.')
-            their_answer = stdscr.getkey()
+            count, size = WRITERS[args.format](questions, args.output_file)
+        if stats is not None:
+            stats.size += size
+    if args.verbose:
+        print(f'Outputting {count} questions.', file=sys.stderr)
+
+    return 0
 
 def main() -> int:
     """The main event."""
@@ -340,39 +1730,78 @@ def main() -> int:
                       help='Correctly answered questions are not output.')
     argp.add_argument('-s', '--shuffle-abcd', action='store_true',
                       help='Implies -a.  The multiple-choices are shuffled.')
-    argg = argp.add_mutually_exclusive_group()
-    # TODO Add -I and -E options to read included/excluded numbers from file
     # TODO Clarify how -i and -e regexes work (anchored to beginning)?
-    argg.add_argument('-i', '--include', action='append', metavar='RE',
+    argp.add_argument('-i', '--include', action='append', metavar='RE',
                       help='Only include question numbers that match RE.')
-    argg.add_argument('-e', '--exclude', action='append', metavar='RE',
+    argp.add_argument('-I', '--include-file', action='append', default=[],
+                      metavar='FILE',
+                      help='Like -i for each line (e.g. a question number) '
+                      'of FILE.')
+    argp.add_argument('-e', '--exclude', action='append', metavar='RE',
                       help='Exclude any question numbers that match RE.')
-    argp.add_argument('-o', '--output-file', metavar='FILE',
-                      help='Output the questions to text FILE.',
-                      type=argparse.FileType('w'), default=sys.stdout)
+    argp.add_argument('-E', '--exclude-file', action='append', default=[],
+                      metavar='FILE',
+                      help='Like -e for each line (e.g. a question number) '
+                      'of FILE.')
+    argp.add_argument('--format', choices=WRITERS, default='text',
+                      help='The format of the output questions '
+                      '(default: %(default)s).')
+    output_group = argp.add_mutually_exclusive_group()
+    output_group.add_argument('-o', '--output-file', metavar='FILE',
+                              help='Output the questions to FILE.',
+                              type=argparse.FileType('w'), default=sys.stdout)
+    output_group.add_argument('--compile', metavar='FILE',
+                              type=argparse.FileType('wb'),
+                              help='Output the questions to FILE as a '
+                              'compiled pool that can be used as one of '
+                              'POOL_FILES.')
+    output_group.add_argument('--sqlite', metavar='FILE',
+                              help='Output the questions to the SQLite '
+                              'database FILE that can be used as one of '
+                              'POOL_FILES.')
+    argp.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                      help='Use up to N processes to extract POOL_FILES.')
+    argp.add_argument('--no-cache', action='store_true',
+                      help='Do not read or write the parsed-pool cache.')
+    argp.add_argument('--profile', action='store_true',
+                      help='Print the time, size and peak memory of each '
+                      'stage for each file to stderr.')
+    argp.add_argument('--profile-stats', metavar='FILE',
+                      help='Implies --profile.  Also save cProfile '
+                      'statistics to FILE for use with pstats.')
     argp.add_argument('question_pools', nargs='+', metavar='POOL_FILES',
-                      help='.docx, .pdf or .txt containing a question pool')
+                      help='.docx, .pdf, .txt, compiled .pool or SQLite '
+                      'file containing a question pool')
     args = argp.parse_args()
+    if args.jobs < 1:
+        argp.error('argument -j/--jobs: must be at least 1')
+    try:
+        for filename in args.include_file:
+            args.include = (args.include or []) + read_re_file(filename)
+        for filename in args.exclude_file:
+            args.exclude = (args.exclude or []) + read_re_file(filename)
+    except OSError as err:
+        argp.error(str(err))
+    if args.include is not None and args.exclude is not None:
+        argp.error('questions cannot be both included (-i/-I) '
+                   'and excluded (-e/-E)')
 
-    text = get_text_from_file(args.question_pools)
-    questions = parse_questions(text, args.include, args.exclude)
+    if args.profile_stats:
+        args.profile = True
+    if args.profile:
+        global PROFILER # pylint: disable=global-statement
+        PROFILER = Profiler()
 
-    if args.shuffle_abcd:
-        args.ask_questions = True
-    if args.ask_questions:
-        try:
-            curses.wrapper(ask_questions, questions, args.shuffle_abcd)
-        except WinTooSmallError:
-            print('The terminal window must be at least 80x24.',
-                  file=sys.stderr)
-            return 1
-
-    if args.verbose:
-        print(f'Outputting {len(questions)} questions.', file=sys.stderr)
-    for question_number in questions:
-        print(questions[question_number], file=args.output_file)
-
-    return 0
+    if args.profile_stats:
+        import cProfile
+        stats_profile = cProfile.Profile()
+        status: int = stats_profile.runcall(process_questions, args)
+        stats_profile.dump_stats(args.profile_stats)
+    else:
+        status = process_questions(args)
+    if PROFILER:
+        PROFILER.print_summary(sys.stderr)
+    return status
 
 if __name__ == "__main__":
     sys.exit(main())